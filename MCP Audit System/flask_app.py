@@ -7,27 +7,36 @@ MCP communication, and AI integration.
 """
 
 import os
+import asyncio
 import sys
 import json
+import decimal
 import logging
 import subprocess
 import threading
 import time
 import uuid
-import tempfile
+import itertools
+import queue
+import select
 import signal
-import psutil
+import atexit
+from collections import defaultdict
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from pathlib import Path
-import requests
 
 from flask import (
     Flask, render_template, request, jsonify, redirect, url_for, 
     flash, session, send_file, abort
 )
+from flask.json.provider import JSONProvider
+from jinja2 import FileSystemBytecodeCache
 from werkzeug.utils import secure_filename
-import openai
+import orjson
+from cachetools import TTLCache
 
 # Configure comprehensive logging for Flask application
 logging.basicConfig(
@@ -40,13 +49,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger('MCPAuditFlaskApp')
 
+# Imported after logging is configured: sample_mcp_server calls basicConfig() on import
+from sample_mcp_server import SimpleMCPServer
+
 # Configure Flask's built-in logger
 flask_logger = logging.getLogger('werkzeug')
 flask_logger.setLevel(logging.INFO)
 
 # Setup comprehensive logging
-class WebAppFormatter(logging.Formatter):
-    """Custom formatter for web application logging"""
+class WebAppEmojiFilter(logging.Filter):
+    """Tag records with a level emoji for the %(emoji)s format field"""
     
     EMOJI_MAP = {
         'DEBUG': '🔍',
@@ -56,63 +68,202 @@ class WebAppFormatter(logging.Formatter):
         'CRITICAL': '🚨'
     }
     
-    def format(self, record):
-        emoji = self.EMOJI_MAP.get(record.levelname, '🌐')
-        record.msg = f'{emoji} {record.msg}'
-        return super().format(record)
+    def filter(self, record):
+        # Adds an attribute instead of rewriting record.msg, so handlers sharing
+        # the record never see a prefixed message
+        record.emoji = self.EMOJI_MAP.get(record.levelname, '🌐')
+        return True
 
 def setup_web_logging():
     """Setup web application logging"""
     logger = logging.getLogger('MCPAuditWebApp')
     logger.setLevel(logging.DEBUG)
+    emoji_filter = WebAppEmojiFilter()
     
-    # File handler
+    # File handler, batched in memory and flushed every 1024 records or on ERROR
     file_handler = logging.FileHandler('mcp_audit_system.log')
     file_handler.setLevel(logging.DEBUG)
-    file_formatter = WebAppFormatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+    file_formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(emoji)s %(message)s'
     )
     file_handler.setFormatter(file_formatter)
+    file_handler.addFilter(emoji_filter)
+    buffered_file_handler = MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    buffered_file_handler.setLevel(logging.DEBUG)
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    console_formatter = WebAppFormatter(
-        '%(asctime)s - %(levelname)s - %(message)s'
+    console_formatter = logging.Formatter(
+        '%(asctime)s - %(levelname)s - %(emoji)s %(message)s'
     )
     console_handler.setFormatter(console_formatter)
+    console_handler.addFilter(emoji_filter)
+    
+    # Request threads only enqueue records; a background listener does the I/O.
+    # Root handlers (logs/flask_app.log) are included since records no longer propagate.
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue,
+        buffered_file_handler,
+        console_handler,
+        *logging.getLogger().handlers,
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
     
     return logger
 
 logger = setup_web_logging()
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    @staticmethod
+    def _default(obj):
+        if hasattr(obj, '__html__'):
+            return str(obj.__html__())
+        if isinstance(obj, decimal.Decimal):
+            return str(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # kwargs such as separators/sort_keys are ignored, orjson output is always compact
+        return orjson.dumps(obj, default=self._default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 # Flask app configuration
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = 'audit-system-secret-key-2025'
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# Templates are compiled once per worker; only the dev server watches for edits
+app.config['TEMPLATES_AUTO_RELOAD'] = os.getenv('FLASK_ENV') == 'development'
+os.makedirs('.jinja_cache', exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache('.jinja_cache')
+
 # Ensure upload directory exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
+def stream_save(dst_path: str, chunk: int = 1 << 20) -> int:
+    """
+    Write the raw request body to disk in fixed-size chunks
+    
+    Upload routes must call this instead of request.files['file'].save():
+    it reads request.stream directly, so Werkzeug never parses or buffers
+    the body in memory. Returns the number of bytes written.
+    """
+    written = 0
+    with open(dst_path, 'wb') as f:
+        while data := request.stream.read(chunk):
+            f.write(data)
+            written += len(data)
+    logger.info(f"WEB: Saved upload to {dst_path} ({written} bytes)")
+    return written
+
+# Server launch commands (interpreter is prepended; network servers get --host/--port)
+SERVER_CMD_TEMPLATES = {
+    'SecureAudit': ('servers/secure_audit_server.py', '--transport', 'stdio'),
+    'SampleServer': ('servers/sample_server.py', '--transport', 'stdio'),
+    'HttpAuditServer': ('servers/http_audit_server.py', '--transport', 'http'),
+    'SSEAuditServer': ('servers/sse_audit_server.py', '--transport', 'sse')
+}
+NETWORK_SERVERS = frozenset({'HttpAuditServer', 'SSEAuditServer'})
+
+_sample_server = SimpleMCPServer()
+
+async def _inproc_echo(message: str = '') -> Dict[str, Any]:
+    """Echo via SimpleMCPServer, shaped like servers/sample_server.py's tools/call result"""
+    result = await _sample_server.echo_tool(message)
+    return {
+        'content': [{'type': 'text', 'text': f"Echo: {result['echoed_message']}"}],
+        'isError': False
+    }
+
+# Side-effect-free tools served in-process instead of over JSON-RPC: {server: {tool: coroutine fn}}
+INPROC_TOOLS = {
+    'SampleServer': {'echo': _inproc_echo}
+}
+
+# Editable audit form fields
+AUDIT_FIELDS = ('title', 'description', 'date', 'status', 'assigned_auditor')
+AUDIT_FIELD_DEFAULTS = {'status': 'open'}
+
+_CLK_TCK = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+def _fast_proc_stat(pid: int) -> List[str]:
+    """Fields of /proc/<pid>/stat after the command name (Linux only)"""
+    with open(f'/proc/{pid}/stat') as f:
+        stat = f.read()
+    # The command name may contain spaces, so split after its closing parenthesis
+    return stat[stat.rindex(')') + 2:].split()
+
+def process_usage(pid: int) -> Dict[str, Any]:
+    """CPU time and resident memory of a process"""
+    try:
+        if sys.platform.startswith('linux'):
+            fields = _fast_proc_stat(pid)
+            # utime, stime and rss are stat fields 14, 15 and 24
+            return {
+                'cpu_seconds': (int(fields[11]) + int(fields[12])) / _CLK_TCK,
+                'memory_rss': int(fields[21]) * _PAGE_SIZE
+            }
+        
+        import psutil  # Fallback for non-Linux platforms
+        proc = psutil.Process(pid)
+        cpu = proc.cpu_times()
+        return {
+            'cpu_seconds': cpu.user + cpu.system,
+            'memory_rss': proc.memory_info().rss
+        }
+    except Exception:
+        return {}
+
 class ServerManager:
     """Comprehensive MCP server management system"""
     
+    STATUS_TTL = 1.0  # Seconds a polled server status stays fresh
+    
+    # Parsed configs shared across instances: {config_path: (st_mtime, config)}
+    _config_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+    
     def __init__(self, config_path: str = "server_config.json"):
         self.config_path = config_path
         self.config = self._load_config()
+        self._servers_by_name: Dict[str, Dict[str, Any]] = self.config.get('servers', {})
         self.active_servers = {}  # {server_name: process_info}
+        self._start_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._starting: Dict[str, threading.Event] = {}  # In-flight starts
+        self._start_results: Dict[str, Tuple[bool, str]] = {}
+        self._status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}  # {name: (monotonic ts, status)}
+        self._monitor_thread: Optional[threading.Thread] = None
         self.current_server = self.config.get('default_server', 'SecureAudit')
         logger.info(f"SERVER: Server manager initialized with config: {config_path}")
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load server configuration from JSON file"""
+        """Load server configuration from JSON file, reparsing only when it changes"""
         try:
+            mtime = os.stat(self.config_path).st_mtime
+            cached = self._config_cache.get(self.config_path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            
             with open(self.config_path, 'r') as f:
                 config = json.load(f)
+            self._config_cache[self.config_path] = (mtime, config)
             logger.info(f"SERVER: Configuration loaded successfully")
             return config
         except Exception as e:
@@ -124,12 +275,12 @@ class ServerManager:
     
     def get_server_config(self, server_name: str) -> Optional[Dict[str, Any]]:
         """Get configuration for a specific server"""
-        return self.config.get('servers', {}).get(server_name)
+        return self._servers_by_name.get(server_name)
     
     def list_servers(self) -> Dict[str, Any]:
         """List all configured servers with their status"""
         servers = {}
-        for name, config in self.config.get('servers', {}).items():
+        for name, config in self._servers_by_name.items():
             status = self.get_server_status(name)
             servers[name] = {
                 'config': config,
@@ -139,63 +290,113 @@ class ServerManager:
         return servers
     
     def get_server_status(self, server_name: str) -> Dict[str, Any]:
-        """Get current status of a server"""
-        if server_name in self.active_servers:
-            process_info = self.active_servers[server_name]
+        """Get current status of a server (cached for STATUS_TTL seconds)"""
+        cached = self._status_cache.get(server_name)
+        if cached and time.monotonic() - cached[0] < self.STATUS_TTL:
+            return cached[1]
+        return self._refresh_status(server_name)
+    
+    def _refresh_status(self, server_name: str) -> Dict[str, Any]:
+        """Poll the server process and update the status cache"""
+        process_info = self.active_servers.get(server_name)
+        if process_info:
             process = process_info['process']
+            exit_code = process.poll()
             
-            if process.poll() is None:  # Process still running
-                return {
+            if exit_code is None:  # Process still running
+                status = {
                     'running': True,
                     'pid': process.pid,
                     'started_at': process_info['started_at'],
-                    'uptime': time.time() - process_info['start_time']
+                    'uptime': time.time() - process_info['start_time'],
+                    **process_usage(process.pid)
                 }
             else:
                 # Process has ended
-                del self.active_servers[server_name]
-                return {
+                self.active_servers.pop(server_name, None)
+                status = {
                     'running': False,
-                    'exit_code': process.poll(),
+                    'exit_code': exit_code,
                     'ended_at': datetime.now().isoformat()
                 }
+        else:
+            status = {'running': False}
         
-        return {'running': False}
+        self._status_cache[server_name] = (time.monotonic(), status)
+        return status
+    
+    def _status_monitor(self):
+        """Background thread refreshing the status of running servers"""
+        while True:
+            time.sleep(self.STATUS_TTL)
+            for server_name in list(self.active_servers):
+                try:
+                    self._refresh_status(server_name)
+                except Exception as e:
+                    logger.error(f"SERVER: Status poll failed for {server_name} - {str(e)}")
+    
+    def _ensure_status_monitor(self):
+        if self._monitor_thread is None:
+            self._monitor_thread = threading.Thread(
+                target=self._status_monitor,
+                name='server-status-monitor',
+                daemon=True
+            )
+            self._monitor_thread.start()
     
     def start_server(self, server_name: str) -> Tuple[bool, str]:
         """Start a specific MCP server"""
         logger.info(f"SERVER: Starting server {server_name}")
         
-        if server_name in self.active_servers:
-            status = self.get_server_status(server_name)
-            if status['running']:
-                return False, f"Server {server_name} is already running"
+        # Another request is already spawning this server, share its result
+        starting = self._starting.get(server_name)
+        if starting is not None:
+            starting.wait()
+            return self._start_results.get(server_name, (False, f"Failed to start {server_name}"))
         
+        with self._start_locks[server_name]:
+            if server_name in self.active_servers:
+                status = self._refresh_status(server_name)
+                if status['running']:
+                    return False, f"Server {server_name} is already running"
+            
+            event = threading.Event()
+            self._starting[server_name] = event
+            try:
+                result = self._spawn_server(server_name)
+                self._start_results[server_name] = result
+                return result
+            finally:
+                event.set()
+                del self._starting[server_name]
+    
+    def _spawn_server(self, server_name: str) -> Tuple[bool, str]:
+        """Spawn the server process, called with the server's start lock held"""
         config = self.get_server_config(server_name)
         if not config:
             return False, f"Server {server_name} not found in configuration"
         
         try:
-            # Build command based on server name with simplified config
-            server_commands = {
-                'SecureAudit': ['python3', 'servers/secure_audit_server.py', '--transport', 'stdio'],
-                'SampleServer': ['python3', 'servers/sample_server.py', '--transport', 'stdio'],
-                'HttpAuditServer': ['python3', 'servers/http_audit_server.py', '--transport', 'http', '--host', config['host'], '--port', str(config['port'])],
-                'SSEAuditServer': ['python3', 'servers/sse_audit_server.py', '--transport', 'sse', '--host', config['host'], '--port', str(config['port'])]
-            }
-            
-            cmd = server_commands.get(server_name)
-            if not cmd:
+            template = SERVER_CMD_TEMPLATES.get(server_name)
+            if not template:
                 return False, f"Unknown server: {server_name}"
             
-            # Start process
+            cmd = [sys.executable, *template]
+            if server_name in NETWORK_SERVERS:
+                cmd += ['--host', config['host'], '--port', str(config['port'])]
+            
+            # Start process; only stdio servers need pipes. Servers log to their own
+            # files, and an undrained stderr pipe would eventually block them.
+            # No cwd and close_fds=False let CPython use posix_spawn; our own fds are
+            # non-inheritable (PEP 446) so nothing leaks into the child.
+            stdio = server_name not in NETWORK_SERVERS
             process = subprocess.Popen(
                 cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdin=subprocess.PIPE if stdio else subprocess.DEVNULL,
+                stdout=subprocess.PIPE if stdio else subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                cwd='.'
+                close_fds=False
             )
             
             # Store process info
@@ -206,6 +407,9 @@ class ServerManager:
                 'config': config
             }
             
+            self._status_cache.pop(server_name, None)
+            self._ensure_status_monitor()
+            
             logger.info(f"SERVER: Started {server_name} with PID {process.pid}")
             return True, f"Started {server_name} successfully"
             
@@ -235,7 +439,8 @@ class ServerManager:
                 process.kill()
                 process.wait()
             
-            del self.active_servers[server_name]
+            self.active_servers.pop(server_name, None)
+            self._status_cache.pop(server_name, None)
             logger.info(f"SERVER: Stopped {server_name}")
             return True, f"Stopped {server_name} successfully"
             
@@ -247,7 +452,7 @@ class ServerManager:
         """Switch to a different server as the current active server"""
         logger.info(f"SERVER: Switching to server {server_name}")
         
-        if server_name not in self.config.get('servers', {}):
+        if server_name not in self._servers_by_name:
             return False, f"Server {server_name} not found"
         
         # Start the new server if not running
@@ -260,16 +465,278 @@ class ServerManager:
         logger.info(f"SERVER: Switched to {server_name}")
         return True, f"Switched to {server_name}"
 
+class MCPSession:
+    """Initialized JSON-RPC session over the stdio pipes of an MCP server"""
+    
+    PROTOCOL_VERSION = '2024-11-05'
+    READ_TIMEOUT = 30.0  # Seconds to wait for a response before giving up on the pipe
+    
+    # Pre-serialized envelope pieces; only the id and arguments vary per call
+    _RPC_PREFIX = b'{"jsonrpc":"2.0","id":'
+    _TOOL_CALL_HEADS: Dict[str, bytes] = {}  # {tool_name: ',"method":"tools/call","params":{"name":...,"arguments":'}
+    _NO_ARG_TAILS: Dict[str, bytes] = {}  # {tool_name: full frame after the id for calls without arguments}
+    
+    # Shared across sessions so a late reply to a discarded session never matches a new request
+    _request_ids = itertools.count(1)
+    
+    def __init__(self, server_name: str, process: subprocess.Popen):
+        self.server_name = server_name
+        self.process = process
+        self.created_at = time.monotonic()
+        self._stdout_fd = process.stdout.fileno()
+        self._read_buffer = bytearray()  # Raw stdout bytes not yet split into lines
+    
+    @classmethod
+    def _tool_call_tail(cls, tool_name: str, arguments: Dict[str, Any]) -> bytes:
+        if not arguments:
+            tail = cls._NO_ARG_TAILS.get(tool_name)
+            if tail is None:
+                tail = cls._NO_ARG_TAILS[tool_name] = cls._tool_call_head(tool_name) + b'{}}}\n'
+            return tail
+        return cls._tool_call_head(tool_name) + orjson.dumps(arguments) + b'}}\n'
+    
+    @classmethod
+    def _tool_call_head(cls, tool_name: str) -> bytes:
+        head = cls._TOOL_CALL_HEADS.get(tool_name)
+        if head is None:
+            head = cls._TOOL_CALL_HEADS[tool_name] = (
+                b',"method":"tools/call","params":{"name":' + orjson.dumps(tool_name) + b',"arguments":'
+            )
+        return head
+    
+    def _frame(self, request_id: int, method: str, params: Optional[Dict[str, Any]]) -> bytes:
+        """Serialize one newline-terminated JSON-RPC request"""
+        if method == 'tools/call':
+            tail = self._tool_call_tail(params['name'], params.get('arguments'))
+        else:
+            tail = b',"method":' + orjson.dumps(method) + b',"params":' + orjson.dumps(params or {}) + b'}\n'
+        return self._RPC_PREFIX + str(request_id).encode() + tail
+    
+    def _write(self, data: bytes):
+        stdin = self.process.stdin.buffer  # Frames are already UTF-8, skip the text layer
+        stdin.write(data)
+        stdin.flush()
+    
+    def _send(self, message: Dict[str, Any]):
+        self._write(orjson.dumps(message) + b'\n')
+    
+    def _readline(self, deadline: float) -> bytes:
+        """Read one line from the server's stdout, raising TimeoutError past the deadline"""
+        while True:
+            end = self._read_buffer.find(b'\n')
+            if end >= 0:
+                line = bytes(self._read_buffer[:end + 1])
+                del self._read_buffer[:end + 1]
+                return line
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self._stdout_fd], [], [], remaining)[0]:
+                raise TimeoutError(f'Server {self.server_name} did not respond within {self.READ_TIMEOUT}s')
+            chunk = os.read(self._stdout_fd, 65536)
+            if not chunk:
+                raise RuntimeError(f'Server {self.server_name} closed the connection')
+            self._read_buffer += chunk
+    
+    def request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a JSON-RPC request and wait for the matching response"""
+        request_id = next(self._request_ids)
+        self._write(self._frame(request_id, method, params))
+        deadline = time.monotonic() + self.READ_TIMEOUT
+        
+        # Skip server notifications until the response for this request arrives
+        while True:
+            response = orjson.loads(self._readline(deadline))
+            if response.get('id') == request_id:
+                return response
+    
+    def request_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Pipeline several requests in a single write and collect the responses in order"""
+        request_ids = []
+        frames = []
+        for method, params in calls:
+            request_id = next(self._request_ids)
+            request_ids.append(request_id)
+            frames.append(self._frame(request_id, method, params))
+        self._write(b''.join(frames))
+        deadline = time.monotonic() + self.READ_TIMEOUT
+        
+        pending = set(request_ids)
+        responses = {}
+        while pending:
+            response = orjson.loads(self._readline(deadline))
+            request_id = response.get('id')
+            if request_id in pending:
+                pending.discard(request_id)
+                responses[request_id] = response
+        return [responses[request_id] for request_id in request_ids]
+    
+    def notify(self, method: str, params: Optional[Dict[str, Any]] = None):
+        """Send a JSON-RPC notification (no response expected)"""
+        message = {'jsonrpc': '2.0', 'method': method}
+        if params:
+            message['params'] = params
+        self._send(message)
+    
+    def initialize(self) -> Dict[str, Any]:
+        """Perform the MCP initialize handshake"""
+        response = self.request('initialize', {
+            'protocolVersion': self.PROTOCOL_VERSION,
+            'capabilities': {},
+            'clientInfo': {'name': 'MCPAuditFlaskApp', 'version': '1.0.0'}
+        })
+        if 'error' in response:
+            raise RuntimeError(f"Initialize failed: {response['error']}")
+        self.notify('notifications/initialized')
+        return response.get('result', {})
+    
+    def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool and return the raw JSON-RPC response"""
+        return self.request('tools/call', {'name': tool_name, 'arguments': arguments})
+    
+    def close(self):
+        """Drop the process handle and any unread output; the server process itself is left running"""
+        self.process = None
+        self._read_buffer.clear()
+    
+    def is_healthy(self, process: subprocess.Popen, ttl: float) -> bool:
+        """Check the session still targets the live server process and has not expired"""
+        return (
+            self.process is process
+            and process.poll() is None
+            and time.monotonic() - self.created_at < ttl
+        )
+
+class MCPSessionPool:
+    """Pool of initialized MCP sessions keyed by server name"""
+    
+    def __init__(self, server_manager: ServerManager, connect: Callable[[str], subprocess.Popen],
+                 ttl: float = 300.0, acquire_timeout: float = 30.0):
+        self.server_manager = server_manager
+        self._connect = connect
+        self.ttl = ttl
+        self.acquire_timeout = acquire_timeout
+        # A stdio server has a single pipe, so each queue holds one session slot
+        self._pools: Dict[str, queue.Queue] = {}
+        self._locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        logger.info(f"CLIENT: Session pool initialized (ttl: {ttl}s)")
+    
+    def _get_pool(self, server_name: str) -> queue.Queue:
+        with self._locks[server_name]:
+            pool = self._pools.get(server_name)
+            if pool is None:
+                pool = queue.Queue(maxsize=1)
+                pool.put(None)  # Empty slot, session is opened lazily
+                self._pools[server_name] = pool
+            return pool
+    
+    def _open(self, server_name: str) -> MCPSession:
+        process = self._connect(server_name)
+        session = MCPSession(server_name, process)
+        session.initialize()
+        logger.info(f"CLIENT: Opened MCP session to {server_name}")
+        return session
+    
+    def acquire(self, server_name: str) -> MCPSession:
+        """Take the session for a server, reconnecting if it is missing, stale or expired"""
+        try:
+            session = self._get_pool(server_name).get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise RuntimeError(f'Timed out waiting for a session to {server_name}')
+        
+        try:
+            process_info = self.server_manager.active_servers.get(server_name)
+            if session is None or not process_info or not session.is_healthy(process_info['process'], self.ttl):
+                session = self._open(server_name)
+        except Exception:
+            self.release(server_name, None)
+            raise
+        return session
+    
+    def release(self, server_name: str, session: Optional[MCPSession]):
+        """Return a session to the pool; pass None to discard a broken one"""
+        try:
+            self._get_pool(server_name).put_nowait(session)
+        except queue.Full:
+            # The slot was refilled by close_all() while this session was checked out
+            if session is not None:
+                session.close()
+    
+    @contextmanager
+    def session(self, server_name: str):
+        """Context manager pairing acquire() with release()"""
+        session = self.acquire(server_name)
+        try:
+            yield session
+        except Exception:
+            # Transport state is unknown after a failure, reconnect next time
+            session = None
+            raise
+        finally:
+            self.release(server_name, session)
+    
+    def close_all(self):
+        """Close all pooled sessions, leaving each server with an empty slot"""
+        for server_name in list(self._pools):
+            with self._locks[server_name]:
+                pool = self._pools[server_name]
+                while True:
+                    try:
+                        session = pool.get_nowait()
+                    except queue.Empty:
+                        break
+                    if session is not None:
+                        session.close()
+                # Sessions still checked out are closed when released into the full slot
+                pool.put_nowait(None)
+        logger.info("CLIENT: Session pool closed")
+
 class MCPClient:
     """MCP communication client for tool calls and resource access"""
     
     def __init__(self, server_manager: ServerManager):
         self.server_manager = server_manager
+        self.session_pool = MCPSessionPool(server_manager, self.connect)
         logger.info("CLIENT: MCP client initialized")
     
+    def connect(self, server_name: str) -> subprocess.Popen:
+        """Attach to the stdio pipes of a server started by the server manager"""
+        process_info = self.server_manager.active_servers.get(server_name)
+        if not process_info:
+            raise RuntimeError(f'Server {server_name} is not running')
+        process = process_info['process']
+        if process.stdout is None:
+            raise RuntimeError(f'Server {server_name} does not use the stdio transport')
+        
+        logger.info(f"CLIENT: Connected to {server_name} (PID {process.pid})")
+        return process
+    
+    def _tool_result(self, tool_name: str, kwargs: Dict[str, Any], response: Dict[str, Any],
+                     execution_time: float, now_iso: str) -> Dict[str, Any]:
+        """Convert a JSON-RPC tools/call response into the client's result dict"""
+        if 'error' in response:
+            error = response['error']
+            error_msg = error.get('message', str(error)) if isinstance(error, dict) else str(error)
+            logger.error(f"MCP_ERROR: Tool '{tool_name}' failed - {error_msg} (execution time: {execution_time:.3f}s)")
+            return {
+                'success': False,
+                'error': f'Tool execution failed: {error_msg}',
+                'tool': tool_name,
+                'timestamp': now_iso
+            }
+        
+        logger.info(f"MCP_RESPONSE: Tool '{tool_name}' executed successfully (execution time: {execution_time:.3f}s)")
+        return {
+            'success': True,
+            'tool': tool_name,
+            'result': response.get('result'),
+            'args': kwargs,
+            'timestamp': now_iso
+        }
+    
     def call_tool(self, tool_name: str, **kwargs) -> Dict[str, Any]:
         """Call a tool on the current MCP server"""
-        start_time = datetime.now()
+        t0 = time.monotonic()
+        now_iso = datetime.now().isoformat()
         logger.info(f"MCP_REQUEST: Calling tool '{tool_name}' with arguments: {kwargs}")
         
         server_name = self.server_manager.current_server
@@ -282,76 +749,65 @@ class MCPClient:
                 'error': error_msg
             }
         
+        inproc_tool = INPROC_TOOLS.get(server_name, {}).get(tool_name)
+        
         try:
-            # Create temporary Python script for MCP communication
-            script_content = f'''
-import json
-import sys
-import subprocess
-
-# MCP tool call via JSON-RPC
-request = {{
-    "jsonrpc": "2.0",
-    "id": 1,
-    "method": "tools/call",
-    "params": {{
-        "name": "{tool_name}",
-        "arguments": {json.dumps(kwargs)}
-    }}
-}}
-
-# Send request to MCP server (simplified)
-print(json.dumps(request))
-'''
+            if inproc_tool:
+                result = asyncio.run(inproc_tool(**kwargs))
+                logger.info(f"MCP_RESPONSE: Tool '{tool_name}' executed in-process (execution time: {time.monotonic() - t0:.3f}s)")
+                return {
+                    'success': True,
+                    'tool': tool_name,
+                    'result': result,
+                    'args': kwargs,
+                    'timestamp': now_iso
+                }
             
-            # Write script to temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(script_content)
-                script_path = f.name
+            with self.session_pool.session(server_name) as session:
+                response = session.call_tool(tool_name, kwargs)
             
-            try:
-                # Execute script and capture output
-                result = subprocess.run(
-                    [sys.executable, script_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
-                    # Parse response (simplified)
-                    response_data = {
-                        'success': True,
-                        'tool': tool_name,
-                        'result': f'Tool {tool_name} called successfully',
-                        'args': kwargs,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    execution_time = (datetime.now() - start_time).total_seconds()
-                    logger.info(f"MCP_RESPONSE: Tool '{tool_name}' executed successfully (execution time: {execution_time:.3f}s)")
-                    return response_data
-                else:
-                    execution_time = (datetime.now() - start_time).total_seconds()
-                    logger.error(f"MCP_ERROR: Tool '{tool_name}' failed - {result.stderr} (execution time: {execution_time:.3f}s)")
-                    return {
-                        'success': False,
-                        'error': f'Tool execution failed: {result.stderr}',
-                        'tool': tool_name
-                    }
-            
-            finally:
-                # Clean up temporary file
-                os.unlink(script_path)
+            return self._tool_result(tool_name, kwargs, response, time.monotonic() - t0, now_iso)
         
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.monotonic() - t0
             logger.error(f"MCP_ERROR: Failed to call tool '{tool_name}' - {str(e)} (execution time: {execution_time:.3f}s)")
             return {
                 'success': False,
                 'error': str(e),
-                'tool': tool_name
+                'tool': tool_name,
+                'timestamp': now_iso
             }
     
+    def call_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Call several tools in one round trip, returning results in call order"""
+        server_name = self.server_manager.current_server
+        if server_name not in self.server_manager.active_servers:
+            return [self.call_tool(tool_name, **kwargs) for tool_name, kwargs in calls]
+        
+        t0 = time.monotonic()
+        now_iso = datetime.now().isoformat()
+        logger.info(f"MCP_REQUEST: Calling {len(calls)} tools in one batch: {[name for name, _ in calls]}")
+        
+        try:
+            with self.session_pool.session(server_name) as session:
+                responses = session.request_many([
+                    ('tools/call', {'name': tool_name, 'arguments': kwargs})
+                    for tool_name, kwargs in calls
+                ])
+        except Exception as e:
+            execution_time = time.monotonic() - t0
+            logger.error(f"MCP_ERROR: Batch call failed - {str(e)} (execution time: {execution_time:.3f}s)")
+            return [
+                {'success': False, 'error': str(e), 'tool': tool_name, 'timestamp': now_iso}
+                for tool_name, _ in calls
+            ]
+        
+        execution_time = time.monotonic() - t0
+        return [
+            self._tool_result(tool_name, kwargs, response, execution_time, now_iso)
+            for (tool_name, kwargs), response in zip(calls, responses)
+        ]
+    
     def get_resource(self, resource_uri: str) -> Dict[str, Any]:
         """Get a resource from the current MCP server"""
         logger.info(f"CLIENT: Getting resource {resource_uri}")
@@ -378,6 +834,7 @@ class AIIntegration:
     def __init__(self):
         self.api_key = os.getenv('OPENAI_API_KEY', '')
         if self.api_key:
+            import openai  # Deferred: pulls in httpx/pydantic, only needed with a key
             openai.api_key = self.api_key
         logger.info("AI: OpenAI integration initialized")
     
@@ -450,8 +907,31 @@ class AIIntegration:
 # Initialize components
 server_manager = ServerManager()
 mcp_client = MCPClient(server_manager)
+session_pool = mcp_client.session_pool
 ai_integration = AIIntegration()
 
+# Short-lived cache for read-only MCP calls polled by the dashboard
+STATS_CACHE = TTLCache(maxsize=32, ttl=10)
+_stats_cache_lock = threading.Lock()  # TTLCache is not thread-safe
+
+def cached_tool_call(cache_key: Tuple, tool_name: str, **kwargs) -> Dict[str, Any]:
+    """Call an MCP tool, serving successful results from STATS_CACHE"""
+    with _stats_cache_lock:
+        result = STATS_CACHE.get(cache_key)
+    if result is not None:
+        return result
+    
+    result = mcp_client.call_tool(tool_name, **kwargs)
+    if result.get('success'):
+        with _stats_cache_lock:
+            STATS_CACHE[cache_key] = result
+    return result
+
+def invalidate_stats_cache():
+    """Drop cached results after audits change"""
+    with _stats_cache_lock:
+        STATS_CACHE.clear()
+
 # Flask routes
 @app.route('/')
 def index():
@@ -486,7 +966,8 @@ def list_audits():
     search_filter = request.args.get('search', '')
     
     # Call MCP tool to get audits
-    result = mcp_client.call_tool(
+    result = cached_tool_call(
+        ('list_audits', status_filter, auditor_filter, search_filter),
         'list_audits',
         status=status_filter,
         assigned_auditor=auditor_filter,
@@ -558,39 +1039,20 @@ def audit_detail(audit_id):
 def create_audit():
     """Create a new audit"""
     if request.method == 'POST':
-        form_data = {
-            'title': request.form.get('title', ''),
-            'description': request.form.get('description', ''),
-            'date': request.form.get('date', ''),
-            'status': request.form.get('status', 'open'),
-            'assigned_auditor': request.form.get('assigned_auditor', '')
-        }
+        form_data = {f: request.form.get(f, AUDIT_FIELD_DEFAULTS.get(f, '')) for f in AUDIT_FIELDS}
         logger.info(f"WEB: Creating new audit with data: {form_data}")
         
-        # Get form data
-        title = form_data['title']
-        description = form_data['description']
-        date = form_data['date']
-        status = form_data['status']
-        assigned_auditor = form_data['assigned_auditor']
-        
         # Validate required fields
-        if not title:
+        if not form_data['title']:
             logger.warning("WEB: Audit creation failed - missing title")
             flash('Title is required', 'error')
             return render_template('create_audit.html')
         
         # Call MCP tool to create audit
-        result = mcp_client.call_tool(
-            'create_audit',
-            title=title,
-            description=description,
-            date=date,
-            status=status,
-            assigned_auditor=assigned_auditor
-        )
+        result = mcp_client.call_tool('create_audit', **form_data)
         
         if result.get('success'):
+            invalidate_stats_cache()
             flash('Audit created successfully', 'success')
             return redirect(url_for('list_audits'))
         else:
@@ -604,17 +1066,14 @@ def update_audit(audit_id):
     if request.method == 'POST':
         logger.info(f"WEB: Updating audit {audit_id}")
         
-        # Get form data
-        updates = {}
-        for field in ['title', 'description', 'date', 'status', 'assigned_auditor']:
-            value = request.form.get(field)
-            if value:
-                updates[field] = value
+        # Get non-empty form fields
+        updates = {f: v for f in AUDIT_FIELDS if (v := request.form.get(f))}
         
         # Call MCP tool to update audit
         result = mcp_client.call_tool('update_audit', audit_id=audit_id, **updates)
         
         if result.get('success'):
+            invalidate_stats_cache()
             flash('Audit updated successfully', 'success')
             return redirect(url_for('audit_detail', audit_id=audit_id))
         else:
@@ -641,6 +1100,7 @@ def delete_audit(audit_id):
     result = mcp_client.call_tool('delete_audit', audit_id=audit_id)
     
     if result.get('success'):
+        invalidate_stats_cache()
         flash('Audit deleted successfully', 'success')
     else:
         flash(f'Failed to delete audit: {result.get("error", "Unknown error")}', 'error')
@@ -731,7 +1191,7 @@ def server_status_api(server_name):
 def statistics_api():
     """API endpoint for audit statistics"""
     # Call MCP tool to get statistics
-    result = mcp_client.call_tool('get_audit_statistics')
+    result = cached_tool_call(('get_audit_statistics',), 'get_audit_statistics')
     
     # Mock statistics
     mock_stats = {
@@ -799,14 +1259,24 @@ def main():
     
     # Run Flask app
     try:
-        app.run(
-            host='127.0.0.1',
-            port=5001,
-            debug=True,
-            threaded=True
-        )
+        if os.getenv('FLASK_ENV') == 'development':
+            # Werkzeug dev server with debugger and reloader
+            app.run(
+                host='127.0.0.1',
+                port=5001,
+                debug=True,
+                threaded=True
+            )
+        else:
+            from waitress import serve
+            logger.info("WEB: Serving with waitress on http://127.0.0.1:5001")
+            serve(app, host='127.0.0.1', port=5001, threads=16)
     except KeyboardInterrupt:
+        pass
+    finally:
+        # waitress handles SIGINT itself and returns normally, so clean up here
         logger.info("WEB: Shutting down web application...")
+        session_pool.close_all()
         
         # Stop all running servers
         for server_name in list(server_manager.active_servers.keys()):
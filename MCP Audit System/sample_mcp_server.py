@@ -8,10 +8,23 @@ import asyncio
 import json
 import logging
 import argparse
+import select
 import sys
 from datetime import datetime
 from typing import Dict, Any
 
+# Prefer orjson for the stdio JSON-RPC loop, stdlib json otherwise
+try:
+    import orjson
+    
+    _dumps_bytes = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _loads = json.loads
+
 # Setup basic logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +39,38 @@ class SimpleMCPServer:
         self.tools = {
             'echo': self.echo_tool
         }
+        # Capabilities are static, so build and serialize them once
+        self._capabilities = {
+            'tools': [
+                {
+                    'name': 'echo',
+                    'description': 'Echo back a message with timestamp',
+                    'parameters': {
+                        'message': {
+                            'type': 'string',
+                            'description': 'Message to echo back',
+                            'default': 'Hello, World!'
+                        }
+                    }
+                }
+            ],
+            'resources': [],
+            'prompts': [],
+            'server_info': {
+                'name': 'Sample MCP Server',
+                'version': '1.0.0',
+                'description': 'Simple example server for testing MCP functionality'
+            }
+        }
+        self._capabilities_bytes = _dumps_bytes(self._capabilities)
+        # Error envelopes only differ by id and message, so their fixed parts are encoded once
+        self._unknown_tool_head = b',"result":{"success":false,"error":'
+        self._unknown_tool_tail = b',"available_tools":' + _dumps_bytes(list(self.tools)) + b'}}\n'
+        # JSON-RPC method -> stdio handler
+        self._methods = {
+            'tools/call': self._rpc_tools_call,
+            'initialize': self._rpc_initialize
+        }
         logger.info("Sample MCP Server initialized")
     
     async def echo_tool(self, message: str = "Hello, World!") -> Dict[str, Any]:
@@ -71,95 +116,124 @@ class SimpleMCPServer:
     
     async def get_capabilities(self) -> Dict[str, Any]:
         """Get server capabilities"""
-        return {
-            'tools': [
-                {
-                    'name': 'echo',
-                    'description': 'Echo back a message with timestamp',
-                    'parameters': {
-                        'message': {
-                            'type': 'string',
-                            'description': 'Message to echo back',
-                            'default': 'Hello, World!'
-                        }
-                    }
-                }
-            ],
-            'resources': [],
-            'prompts': [],
-            'server_info': {
-                'name': 'Sample MCP Server',
-                'version': '1.0.0',
-                'description': 'Simple example server for testing MCP functionality'
-            }
-        }
+        return self._capabilities
+    
+    def _rpc_tools_call(self, request: Dict[str, Any], loop: asyncio.AbstractEventLoop, out: bytearray):
+        """Handle a stdio tools/call request"""
+        params = request.get('params', {})
+        tool_name = params.get('name', '')
+        
+        if tool_name not in self.tools:
+            logger.warning(f"Unknown tool requested: {tool_name}")
+            self._write_error(out, request.get('id'), self._unknown_tool_head,
+                              f'Unknown tool: {tool_name}', self._unknown_tool_tail)
+            return
+        
+        # Call tool
+        result = loop.run_until_complete(self.handle_tool_call(tool_name, **params.get('arguments', {})))
+        
+        out.extend(_dumps_bytes({
+            'id': request.get('id'),
+            'result': result
+        }))
+        out.extend(b'\n')
+    
+    def _rpc_initialize(self, request: Dict[str, Any], loop: asyncio.AbstractEventLoop, out: bytearray):
+        """Handle a stdio initialize request"""
+        # Splice the pre-serialized capabilities into the response
+        out.extend(b'{"id":')
+        out.extend(_dumps_bytes(request.get('id')))
+        out.extend(b',"result":')
+        out.extend(self._capabilities_bytes)
+        out.extend(b'}\n')
     
     def run_stdio(self):
         """Run server with stdio transport (simplified)"""
         logger.info("Running Sample MCP Server with stdio transport")
         
+        # One event loop for the lifetime of the server instead of one per request
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        
+        # Responses are batched and written once no more requests are waiting
+        reader = sys.stdin.buffer
+        writer = sys.stdout.buffer
+        out = bytearray()
+        
+        def send(message: Dict[str, Any]):
+            out.extend(_dumps_bytes(message))
+            out.extend(b'\n')
+        
         # Simplified stdio loop for testing
         try:
             while True:
                 try:
+                    if out and not self._input_pending(reader):
+                        writer.write(out)
+                        writer.flush()
+                        out.clear()
+                    
                     # Read input
-                    line = input()
+                    line = reader.readline()
+                    if not line:
+                        break
+                    line = line.strip()
                     if not line:
                         continue
                     
                     # Parse JSON-RPC request
                     try:
-                        request = json.loads(line)
+                        request = _loads(line)
                     except json.JSONDecodeError:
-                        print(json.dumps({
+                        send({
                             'error': 'Invalid JSON',
                             'timestamp': datetime.now().isoformat()
-                        }))
+                        })
                         continue
                     
-                    # Handle request
-                    if request.get('method') == 'tools/call':
-                        tool_name = request.get('params', {}).get('name', '')
-                        tool_args = request.get('params', {}).get('arguments', {})
-                        
-                        # Call tool
-                        result = asyncio.run(self.handle_tool_call(tool_name, **tool_args))
-                        
-                        # Send response
-                        response = {
-                            'id': request.get('id'),
-                            'result': result
-                        }
-                        print(json.dumps(response))
-                    
-                    elif request.get('method') == 'initialize':
-                        capabilities = asyncio.run(self.get_capabilities())
-                        response = {
-                            'id': request.get('id'),
-                            'result': capabilities
-                        }
-                        print(json.dumps(response))
-                    
+                    # Dispatch by method
+                    method = request.get('method')
+                    handler = self._methods.get(method)
+                    if handler is None:
+                        self._write_error(out, request.get('id'), b',"error":',
+                                          f'Unknown method: {method}', b'}\n')
                     else:
-                        response = {
-                            'id': request.get('id'),
-                            'error': f'Unknown method: {request.get("method")}'
-                        }
-                        print(json.dumps(response))
+                        handler(request, loop, out)
                 
-                except EOFError:
-                    break
                 except KeyboardInterrupt:
                     break
                 except Exception as e:
                     logger.error(f"Error handling request: {str(e)}")
-                    print(json.dumps({
+                    send({
                         'error': str(e),
                         'timestamp': datetime.now().isoformat()
-                    }))
+                    })
         
         except KeyboardInterrupt:
             logger.info("Server shutting down...")
+        finally:
+            if out:
+                writer.write(out)
+                writer.flush()
+            loop.close()
+    
+    @staticmethod
+    def _write_error(out: bytearray, request_id: Any, head: bytes, message: str, tail: bytes):
+        """Append an error response built from pre-serialized envelope parts"""
+        out.extend(b'{"id":')
+        out.extend(_dumps_bytes(request_id))
+        out.extend(head)
+        out.extend(_dumps_bytes(message))
+        out.extend(tail)
+    
+    @staticmethod
+    def _input_pending(reader) -> bool:
+        """Whether more request bytes can be read without blocking"""
+        try:
+            ready, _, _ = select.select([reader], [], [], 0)
+        except (OSError, ValueError):
+            return False  # select() does not support pipes on Windows, always flush
+        return bool(ready)
 
 def main():
     """Main entry point"""
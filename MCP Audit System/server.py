@@ -8,22 +8,48 @@ functionality including CRUD operations, statistics, and AI integration.
 """
 
 import asyncio
+import atexit
 import sqlite3
 import json
 import logging
 import argparse
 import sys
 import os
+import re
 import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 from contextlib import asynccontextmanager
 from pathlib import Path
-import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
 import time
 from dataclasses import dataclass
 from enum import Enum
 
+# Prefer orjson for JSON serialization, stdlib json otherwise
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def _dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    
+    _dumps_bytes = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    
+    def _dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+    
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _loads = json.loads
+
 # FastMCP v2 imports
 from fastmcp import FastMCP
 from fastmcp.types import (
@@ -59,17 +85,19 @@ class EmojiFormatter(logging.Formatter):
         'performance': '⚡'
     }
     
+    # One case-insensitive scan finds the operation instead of lowering and testing each key
+    OPERATION_PATTERN = re.compile(
+        r'(?i)\b(' + '|'.join(OPERATION_EMOJIS) + r')\b'
+    )
+    OPERATION_PREFIXES = {op: f'{emoji} ' for op, emoji in OPERATION_EMOJIS.items()}
+    
     def format(self, record):
         # Add emoji based on log level
         level_emoji = self.EMOJI_MAP.get(record.levelname, '📝')
         
         # Add operation emoji based on message content
-        message = record.getMessage()
-        operation_emoji = ''
-        for operation, emoji in self.OPERATION_EMOJIS.items():
-            if operation in message.lower():
-                operation_emoji = f'{emoji} '
-                break
+        match = self.OPERATION_PATTERN.search(record.getMessage())
+        operation_emoji = self.OPERATION_PREFIXES[match.group(1).lower()] if match else ''
         
         record.msg = f'{level_emoji} {operation_emoji}{record.msg}'
         return super().format(record)
@@ -116,7 +144,11 @@ class AuditStatus(Enum):
     CLOSED = "closed"
     CANCELLED = "cancelled"
 
-@dataclass
+# Column order of the audits table, shared by Audit serialization
+_AUDIT_FIELDS = ('id', 'title', 'description', 'date', 'status',
+                 'assigned_auditor', 'created_at', 'updated_at')
+
+@dataclass(slots=True)
 class Audit:
     """Audit data class"""
     id: Optional[int] = None
@@ -128,33 +160,95 @@ class Audit:
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
     
+    def __iter__(self):
+        """Yield column values in table order, so tuple(audit) binds as a row"""
+        for field in _AUDIT_FIELDS:
+            yield getattr(self, field)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert audit to dictionary"""
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'date': self.date,
-            'status': self.status,
-            'assigned_auditor': self.assigned_auditor,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
+        return dict(zip(_AUDIT_FIELDS, self))
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Audit':
         """Create audit from dictionary"""
         return cls(**data)
 
+def _iso_now(_cache=[0, '']) -> str:
+    """Local ISO-8601 timestamp, rebuilding the date/time part only when the second changes"""
+    now = time.time()
+    second = int(now)
+    if second != _cache[0]:
+        _cache[0] = second
+        _cache[1] = datetime.fromtimestamp(second).isoformat()
+    return f"{_cache[1]}.{int((now - second) * 1e6):06d}"
+
+# Filter key -> WHERE clause for list_audits, in bitmask order
+LIST_FILTERS = (
+    ('status', "status = ?"),
+    ('assigned_auditor', "assigned_auditor = ?"),
+    ('date_from', "date >= ?"),
+    ('date_to', "date <= ?"),
+    ('search', "id IN (SELECT rowid FROM audits_fts WHERE audits_fts MATCH ?)"),
+    ('search_like', "(title LIKE ? OR description LIKE ?)"),
+)
+
+# Trigram FTS can only match terms of at least three characters
+FTS_MIN_TERM = 3
+
+def _build_where(mask: int) -> str:
+    """Build the WHERE clause for a filter-presence bitmask"""
+    where = " WHERE 1=1"
+    for bit, (_, clause) in enumerate(LIST_FILTERS):
+        if mask & (1 << bit):
+            where += f" AND {clause}"
+    return where
+
+@lru_cache(maxsize=64)
+def _build_list_query(mask: int) -> str:
+    """Build the list_audits SQL for a filter-presence bitmask"""
+    return "SELECT * FROM audits" + _build_where(mask) + " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+
+@lru_cache(maxsize=64)
+def _build_count_query(mask: int) -> str:
+    """Build the count_audits SQL for a filter-presence bitmask"""
+    return "SELECT COUNT(*) FROM audits" + _build_where(mask)
+
 class DatabaseManager:
     """Comprehensive database manager with connection pooling"""
     
+    # WAL keeps list_audits readers off the writer's lock; mmap and a 64MB cache cut read copies
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL; "
+        "PRAGMA synchronous=NORMAL; "
+        "PRAGMA cache_size=-65536; "
+        "PRAGMA mmap_size=268435456; "
+        "PRAGMA temp_store=MEMORY;"
+    )
+    
+    # Trail values arrive as orjson bytes. SQLite 3.45+ stores them as JSONB;
+    # older versions keep JSON text so JSON1 functions can still query them
+    TRAIL_JSON = 'jsonb(?)' if sqlite3.sqlite_version_info >= (3, 45, 0) else 'CAST(? AS TEXT)'
+    TRAIL_INSERT = f'''
+        INSERT INTO audit_trail (audit_id, action, old_values, new_values, timestamp)
+        VALUES (?, ?, {TRAIL_JSON}, {TRAIL_JSON}, ?)
+    '''
+    TRAIL_BATCH_DELAY = 0.05  # seconds to gather trail entries before one INSERT
+    STATS_TTL = 5.0  # seconds a computed statistics result is reused
+    
     def __init__(self, db_path: str = "audit_database.db"):
         self.db_path = db_path
-        self.connection_pool = []
         self.pool_size = 10
-        self.lock = threading.Lock()
         self._initialize_database()
+        # Server runs on a single asyncio loop, so the pool needs no lock
+        self.connection_pool = deque(self._new_conn() for _ in range(self.pool_size))
+        # Audit trail rows are queued and written in batches by a background task
+        self._trail_queue: Optional[asyncio.Queue] = None
+        self._trail_task: Optional[asyncio.Task] = None
+        # (computed_at, stats); the generation guards against storing a result that raced a write
+        self._stats_cache: Optional[tuple] = None
+        self._stats_generation = 0
+        atexit.register(self.flush_audit_trail_sync)
         logger.info(f"Database manager initialized with database at {db_path}")
     
     def _initialize_database(self):
@@ -163,6 +257,7 @@ class DatabaseManager:
         
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
+            cursor.executescript(self.PRAGMAS)
             
             # Create audits table with comprehensive schema
             cursor.execute('''
@@ -178,11 +273,15 @@ class DatabaseManager:
                 )
             ''')
             
-            # Create indexes for performance
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_audits_status ON audits(status)')
+            # Create indexes for performance; status/auditor filters come with
+            # ORDER BY created_at DESC, so those indexes carry created_at too
+            cursor.execute('DROP INDEX IF EXISTS idx_audits_status')
+            cursor.execute('DROP INDEX IF EXISTS idx_audits_auditor')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_audits_status_created ON audits(status, created_at DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_audits_auditor_created ON audits(assigned_auditor, created_at DESC)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_audits_date ON audits(date)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_audits_auditor ON audits(assigned_auditor)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_audits_created_at ON audits(created_at)')
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_audits_month ON audits(strftime('%Y-%m', created_at))")
             
             # Create audit trail table for comprehensive logging
             cursor.execute('''
@@ -198,40 +297,74 @@ class DatabaseManager:
                 )
             ''')
             
+            self.fts_enabled = self._initialize_search_index(cursor)
+            
             conn.commit()
             logger.info(f"SQL: Database schema created successfully with indexes")
     
+    def _initialize_search_index(self, cursor) -> bool:
+        """Create the FTS5 title/description index kept in sync with audits by triggers"""
+        try:
+            exists = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'audits_fts'"
+            ).fetchone()
+            
+            # Trigram tokens keep the substring semantics of the previous LIKE '%term%' search
+            cursor.executescript('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS audits_fts USING fts5(
+                    title, description, content='audits', content_rowid='id', tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS audits_fts_insert AFTER INSERT ON audits BEGIN
+                    INSERT INTO audits_fts(rowid, title, description)
+                    VALUES (new.id, new.title, new.description);
+                END;
+                CREATE TRIGGER IF NOT EXISTS audits_fts_delete AFTER DELETE ON audits BEGIN
+                    INSERT INTO audits_fts(audits_fts, rowid, title, description)
+                    VALUES ('delete', old.id, old.title, old.description);
+                END;
+                CREATE TRIGGER IF NOT EXISTS audits_fts_update AFTER UPDATE OF title, description ON audits BEGIN
+                    INSERT INTO audits_fts(audits_fts, rowid, title, description)
+                    VALUES ('delete', old.id, old.title, old.description);
+                    INSERT INTO audits_fts(rowid, title, description)
+                    VALUES (new.id, new.title, new.description);
+                END;
+            ''')
+            
+            if not exists:
+                # Index audits created before the search table existed
+                cursor.execute("INSERT INTO audits_fts(audits_fts) VALUES ('rebuild')")
+            return True
+        
+        except sqlite3.OperationalError as e:
+            logger.warning(f"DATABASE: FTS5 search index unavailable, falling back to LIKE - {str(e)}")
+            return False
+    
+    def _new_conn(self) -> sqlite3.Connection:
+        """Open a configured database connection for the pool"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=128)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(self.PRAGMAS)
+        return conn
+    
     @asynccontextmanager
     async def get_connection(self):
         """Get database connection from pool"""
-        conn = None
+        conn = self.connection_pool.pop() if self.connection_pool else self._new_conn()
         try:
-            with self.lock:
-                if self.connection_pool:
-                    conn = self.connection_pool.pop()
-                else:
-                    conn = sqlite3.connect(self.db_path)
-                    conn.row_factory = sqlite3.Row
-            
             yield conn
-            
         finally:
-            if conn:
-                with self.lock:
-                    if len(self.connection_pool) < self.pool_size:
-                        self.connection_pool.append(conn)
-                    else:
-                        conn.close()
+            if len(self.connection_pool) < self.pool_size:
+                self.connection_pool.append(conn)
+            else:
+                conn.close()
     
     async def create_audit(self, audit: Audit) -> int:
         """Create a new audit record"""
-        logger.info(f"DATABASE: Creating new audit with title: {audit.title}")
-        
         async with self.get_connection() as conn:
             cursor = conn.cursor()
             
             # Set timestamps
-            now = datetime.now().isoformat()
+            now = _iso_now()
             audit.created_at = now
             audit.updated_at = now
             
@@ -250,17 +383,50 @@ class DatabaseManager:
             
             audit_id = cursor.lastrowid
             conn.commit()
+            self._invalidate_stats()
             
             # Log to audit trail
-            await self._log_audit_trail(conn, audit_id, "CREATE", None, audit.to_dict())
+            self._log_audit_trail(audit_id, "CREATE", None, audit.to_dict())
             
-            logger.info(f"SQL: Created audit with ID {audit_id}")
+            logger.info("SQL: Created audit with ID %s: %s", audit_id, audit.title)
             return audit_id
     
+    async def create_audits_bulk(self, audits: List[Audit]) -> List[int]:
+        """Create several audit records with one INSERT batch and one commit"""
+        if not audits:
+            return []
+        
+        async with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            now = _iso_now()
+            for audit in audits:
+                audit.created_at = now
+                audit.updated_at = now
+            
+            cursor.executemany('''
+                INSERT INTO audits (title, description, date, status, assigned_auditor, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (a.title, a.description, a.date, a.status, a.assigned_auditor, a.created_at, a.updated_at)
+                for a in audits
+            ])
+            
+            # The batch runs in one write transaction, so its rowids are contiguous
+            last_id = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+            conn.commit()
+            self._invalidate_stats()
+            
+            first_id = last_id - len(audits) + 1
+            for audit_id, audit in enumerate(audits, first_id):
+                audit.id = audit_id
+                self._log_audit_trail(audit_id, "CREATE", None, audit.to_dict())
+            
+            logger.info("SQL: Created %d audits with IDs %d-%d", len(audits), first_id, last_id)
+            return [audit.id for audit in audits]
+    
     async def get_audit(self, audit_id: int) -> Optional[Audit]:
         """Get audit by ID"""
-        logger.debug(f"DATABASE: Retrieving audit with ID {audit_id}")
-        
         async with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT * FROM audits WHERE id = ?', (audit_id,))
@@ -268,68 +434,76 @@ class DatabaseManager:
             
             if row:
                 audit_data = dict(row)
-                logger.info(f"SQL: Retrieved audit {audit_id}")
+                logger.debug("SQL: Retrieved audit %s", audit_id)
                 return Audit.from_dict(audit_data)
             
-            logger.warning(f"DATABASE: Audit {audit_id} not found")
+            logger.warning("DATABASE: Audit %s not found", audit_id)
             return None
     
     async def list_audits(self, filters: Optional[Dict[str, Any]] = None, 
                          limit: int = 100, offset: int = 0) -> List[Audit]:
         """List audits with optional filtering"""
-        logger.info(f"DATABASE: Listing audits with filters: {filters}")
+        rows = await self.list_audits_dict(filters, limit, offset)
+        return [Audit.from_dict(row) for row in rows]
+    
+    def _filter_params(self, filters: Optional[Dict[str, Any]]) -> tuple:
+        """Turn list filters into a filter-presence bitmask and its bound values"""
+        mask = 0
+        params = []
+        if filters:
+            if 'search' in filters and (not self.fts_enabled or len(filters['search']) < FTS_MIN_TERM):
+                filters = dict(filters)
+                filters['search_like'] = filters.pop('search')
+            
+            for bit, (key, _) in enumerate(LIST_FILTERS):
+                if key in filters:
+                    mask |= 1 << bit
+                    if key == 'search':
+                        # Quote the term as one FTS phrase so operators in it are literal
+                        params.append('"' + filters['search'].replace('"', '""') + '"')
+                    elif key == 'search_like':
+                        search_term = f"%{filters['search_like']}%"
+                        params.extend((search_term, search_term))
+                    else:
+                        params.append(filters[key])
+        return mask, params
+    
+    async def count_audits(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count audits matching the list_audits filters"""
+        mask, params = self._filter_params(filters)
+        async with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_build_count_query(mask), tuple(params))
+            return cursor.fetchone()[0]
+    
+    async def list_audits_dict(self, filters: Optional[Dict[str, Any]] = None, 
+                              limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """List audits with optional filtering as plain dicts, skipping the Audit model"""
+        # Only the bound values vary per call; the SQL text comes from a per-mask cache
+        mask, params = self._filter_params(filters)
+        params.extend((limit, offset))
         
         async with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.arraysize = 256
+            cursor.execute(_build_list_query(mask), tuple(params))
+            audits = [dict(row) for row in cursor.fetchall()]
             
-            # Build query with filters
-            query = "SELECT * FROM audits WHERE 1=1"
-            params = []
-            
-            if filters:
-                if 'status' in filters:
-                    query += " AND status = ?"
-                    params.append(filters['status'])
-                
-                if 'assigned_auditor' in filters:
-                    query += " AND assigned_auditor = ?"
-                    params.append(filters['assigned_auditor'])
-                
-                if 'date_from' in filters:
-                    query += " AND date >= ?"
-                    params.append(filters['date_from'])
-                
-                if 'date_to' in filters:
-                    query += " AND date <= ?"
-                    params.append(filters['date_to'])
-                
-                if 'search' in filters:
-                    query += " AND (title LIKE ? OR description LIKE ?)"
-                    search_term = f"%{filters['search']}%"
-                    params.extend([search_term, search_term])
-            
-            query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            audits = [Audit.from_dict(dict(row)) for row in rows]
-            logger.info(f"SQL: Retrieved {len(audits)} audits")
+            logger.debug("SQL: Retrieved %d audits with filters: %s", len(audits), filters)
             return audits
     
-    async def update_audit(self, audit_id: int, updates: Dict[str, Any]) -> bool:
-        """Update audit with given changes"""
-        logger.info(f"DATABASE: Updating audit {audit_id} with changes: {list(updates.keys())}")
-        
-        # Get current values for audit trail
-        old_audit = await self.get_audit(audit_id)
-        if not old_audit:
-            return False
-        
+    async def update_audit(self, audit_id: int, updates: Dict[str, Any]) -> Optional[Audit]:
+        """Update audit with given changes and return the updated audit"""
         async with self.get_connection() as conn:
             cursor = conn.cursor()
             
+            # Get current values for audit trail
+            cursor.execute('SELECT * FROM audits WHERE id = ?', (audit_id,))
+            old_row = cursor.fetchone()
+            if not old_row:
+                logger.warning("DATABASE: Audit %s not found", audit_id)
+                return None
+            
             # Build update query
             set_clauses = []
             params = []
@@ -341,101 +515,108 @@ class DatabaseManager:
             
             if not set_clauses:
                 logger.warning("DATABASE: No valid fields to update")
-                return False
+                return None
             
             # Always update the updated_at timestamp
             set_clauses.append("updated_at = ?")
-            params.append(datetime.now().isoformat())
+            params.append(_iso_now())
             params.append(audit_id)
             
-            query = f"UPDATE audits SET {', '.join(set_clauses)} WHERE id = ?"
+            query = f"UPDATE audits SET {', '.join(set_clauses)} WHERE id = ? RETURNING *"
             cursor.execute(query, params)
+            new_row = cursor.fetchone()
             
-            if cursor.rowcount > 0:
+            if new_row:
                 conn.commit()
+                self._invalidate_stats()
+                new_values = dict(new_row)
                 
                 # Log to audit trail
-                new_audit = await self.get_audit(audit_id)
-                await self._log_audit_trail(conn, audit_id, "UPDATE", 
-                                          old_audit.to_dict(), new_audit.to_dict())
+                self._log_audit_trail(audit_id, "UPDATE", dict(old_row), new_values)
                 
-                logger.info(f"SQL: Updated audit {audit_id}")
-                return True
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("SQL: Updated audit %s with changes: %s", audit_id, list(updates))
+                return Audit.from_dict(new_values)
             
-            logger.warning(f"DATABASE: Failed to update audit {audit_id}")
-            return False
+            # The UPDATE opened an implicit transaction; end it before the connection goes back to the pool
+            conn.rollback()
+            logger.warning("DATABASE: Failed to update audit %s", audit_id)
+            return None
     
     async def delete_audit(self, audit_id: int) -> bool:
         """Delete audit by ID"""
-        logger.info(f"DATABASE: Deleting audit {audit_id}")
-        
-        # Get audit for trail before deletion
-        old_audit = await self.get_audit(audit_id)
-        if not old_audit:
-            return False
-        
         async with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('DELETE FROM audits WHERE id = ?', (audit_id,))
+            # RETURNING hands back the deleted row for the audit trail
+            cursor.execute('DELETE FROM audits WHERE id = ? RETURNING *', (audit_id,))
+            old_row = cursor.fetchone()
             
-            if cursor.rowcount > 0:
+            if old_row:
                 conn.commit()
+                self._invalidate_stats()
                 
                 # Log to audit trail
-                await self._log_audit_trail(conn, audit_id, "DELETE", old_audit.to_dict(), None)
+                self._log_audit_trail(audit_id, "DELETE", dict(old_row), None)
                 
-                logger.info(f"SQL: Deleted audit {audit_id}")
+                logger.info("SQL: Deleted audit %s", audit_id)
                 return True
             
-            logger.warning(f"DATABASE: Failed to delete audit {audit_id}")
+            # The DELETE opened an implicit transaction; end it before the connection goes back to the pool
+            conn.rollback()
+            logger.warning("DATABASE: Failed to delete audit %s", audit_id)
             return False
     
+    def _invalidate_stats(self):
+        """Drop cached statistics after a write"""
+        self._stats_cache = None
+        self._stats_generation += 1
+    
     async def get_audit_statistics(self) -> Dict[str, Any]:
-        """Get comprehensive audit statistics"""
-        logger.info("DATABASE: Generating audit statistics")
+        """Get comprehensive audit statistics, reusing a result younger than STATS_TTL"""
+        cached = self._stats_cache
+        if cached and time.monotonic() - cached[0] < self.STATS_TTL:
+            return cached[1]
+        generation = self._stats_generation
         
         async with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            # Total audits
-            cursor.execute('SELECT COUNT(*) as total FROM audits')
-            total = cursor.fetchone()['total']
-            
-            # Status breakdown
-            cursor.execute('''
-                SELECT status, COUNT(*) as count 
-                FROM audits 
+            # Status, auditor and monthly breakdowns in one pass, tagged by kind;
+            # totals are folded from the per-status rows
+            query = '''
+                SELECT 'status' AS kind, status AS key, COUNT(*) AS count,
+                       SUM(CASE WHEN created_at >= datetime('now', '-30 days') THEN 1 ELSE 0 END) AS recent,
+                       0 AS rank
+                FROM audits
                 GROUP BY status
-            ''')
-            status_breakdown = {row['status']: row['count'] for row in cursor.fetchall()}
-            
-            # Auditor workload
-            cursor.execute('''
-                SELECT assigned_auditor, COUNT(*) as count 
-                FROM audits 
+                UNION ALL
+                SELECT 'auditor', assigned_auditor, COUNT(*), 0, -COUNT(*)
+                FROM audits
                 WHERE assigned_auditor IS NOT NULL AND assigned_auditor != ''
                 GROUP BY assigned_auditor
-                ORDER BY count DESC
-            ''')
-            auditor_workload = {row['assigned_auditor']: row['count'] for row in cursor.fetchall()}
-            
-            # Recent activity (last 30 days)
-            cursor.execute('''
-                SELECT COUNT(*) as count 
-                FROM audits 
-                WHERE created_at >= datetime('now', '-30 days')
-            ''')
-            recent_audits = cursor.fetchone()['count']
-            
-            # Monthly trend (last 12 months)
-            cursor.execute('''
-                SELECT strftime('%Y-%m', created_at) as month, COUNT(*) as count
-                FROM audits 
+                UNION ALL
+                SELECT 'month', strftime('%Y-%m', created_at), COUNT(*), 0, 0
+                FROM audits
                 WHERE created_at >= datetime('now', '-12 months')
                 GROUP BY strftime('%Y-%m', created_at)
-                ORDER BY month
-            ''')
-            monthly_trend = {row['month']: row['count'] for row in cursor.fetchall()}
+                ORDER BY kind, rank, key
+            '''
+            # The aggregate scans every row, so run it off the event loop
+            rows = await asyncio.to_thread(lambda: cursor.execute(query).fetchall())
+            
+            total = 0
+            recent_audits = 0
+            status_breakdown = {}
+            auditor_workload = {}
+            monthly_trend = {}
+            breakdowns = {'auditor': auditor_workload, 'month': monthly_trend}
+            for kind, key, count, recent, _ in rows:
+                if kind == 'status':
+                    status_breakdown[key] = count
+                    total += count
+                    recent_audits += recent
+                else:
+                    breakdowns[kind][key] = count
             
             stats = {
                 'total_audits': total,
@@ -443,27 +624,78 @@ class DatabaseManager:
                 'auditor_workload': auditor_workload,
                 'recent_audits_30_days': recent_audits,
                 'monthly_trend': monthly_trend,
-                'generated_at': datetime.now().isoformat()
+                'generated_at': _iso_now()
             }
             
-            logger.info(f"PERFORMANCE: Generated statistics for {total} audits")
+            if generation == self._stats_generation:
+                self._stats_cache = (time.monotonic(), stats)
+            
+            logger.info("PERFORMANCE: Generated statistics for %d audits", total)
             return stats
     
-    async def _log_audit_trail(self, conn, audit_id: int, action: str, 
-                              old_values: Optional[Dict], new_values: Optional[Dict]):
-        """Log audit trail for comprehensive tracking"""
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO audit_trail (audit_id, action, old_values, new_values, timestamp)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
+    def _log_audit_trail(self, audit_id: int, action: str, 
+                         old_values: Optional[Dict], new_values: Optional[Dict]):
+        """Queue an audit trail entry for the batched trail writer"""
+        entry = (
             audit_id,
             action,
-            json.dumps(old_values) if old_values else None,
-            json.dumps(new_values) if new_values else None,
-            datetime.now().isoformat()
-        ))
-        conn.commit()
+            _dumps_bytes(old_values) if old_values else None,
+            _dumps_bytes(new_values) if new_values else None,
+            _iso_now()
+        )
+        
+        loop = asyncio.get_running_loop()
+        if self._trail_task is None or self._trail_task.done() or self._trail_task.get_loop() is not loop:
+            pending = self._drain_trail_queue()
+            self._trail_queue = asyncio.Queue()
+            for item in pending:
+                self._trail_queue.put_nowait(item)
+            self._trail_task = loop.create_task(self._trail_writer())
+        
+        self._trail_queue.put_nowait(entry)
+    
+    def _drain_trail_queue(self) -> List[tuple]:
+        """Take every entry currently waiting in the trail queue"""
+        entries = []
+        if self._trail_queue is not None:
+            while not self._trail_queue.empty():
+                entries.append(self._trail_queue.get_nowait())
+                self._trail_queue.task_done()
+        return entries
+    
+    async def _trail_writer(self):
+        """Write queued audit trail entries with one executemany per batch"""
+        queue = self._trail_queue
+        while True:
+            entries = [await queue.get()]
+            try:
+                await asyncio.sleep(self.TRAIL_BATCH_DELAY)
+            finally:
+                # Also runs on cancellation so a stopping loop does not drop the batch
+                while not queue.empty():
+                    entries.append(queue.get_nowait())
+                try:
+                    async with self.get_connection() as conn:
+                        conn.executemany(self.TRAIL_INSERT, entries)
+                        conn.commit()
+                    logger.debug("SQL: Wrote %d audit trail entries", len(entries))
+                except Exception as e:
+                    logger.error(f"DATABASE: Failed to write audit trail batch - Error: {str(e)}")
+                for _ in entries:
+                    queue.task_done()
+    
+    async def flush_audit_trail(self):
+        """Wait until every queued audit trail entry has been written"""
+        if self._trail_queue is not None and self._trail_task is not None and not self._trail_task.done():
+            await self._trail_queue.join()
+    
+    def flush_audit_trail_sync(self):
+        """Write any trail entries left behind when the event loop has stopped"""
+        entries = self._drain_trail_queue()
+        if entries:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(self.TRAIL_INSERT, entries)
+            logger.info(f"SQL: Flushed {len(entries)} pending audit trail entries")
 
 # Initialize database manager
 db_manager = DatabaseManager()
@@ -471,6 +703,25 @@ db_manager = DatabaseManager()
 # Initialize FastMCP server
 mcp = FastMCP("Audit Management System")
 
+def _new_audit(title: str, description: str = "", date: str = "",
+               status: str = "open", assigned_auditor: str = "") -> Audit:
+    """Build an Audit for creation, normalizing status and defaulting the date"""
+    # Validate status
+    if status not in [s.value for s in AuditStatus]:
+        status = AuditStatus.OPEN.value
+    
+    # Set default date if not provided
+    if not date:
+        date = datetime.now().date().isoformat()
+    
+    return Audit(
+        title=title,
+        description=description,
+        date=date,
+        status=status,
+        assigned_auditor=assigned_auditor
+    )
+
 # Tool implementations
 @mcp.tool()
 async def create_audit(
@@ -496,21 +747,7 @@ async def create_audit(
     logger.info(f"TOOL_CALL: create_audit - Title: {title}")
     
     try:
-        # Validate status
-        if status not in [s.value for s in AuditStatus]:
-            status = AuditStatus.OPEN.value
-        
-        # Set default date if not provided
-        if not date:
-            date = datetime.now().date().isoformat()
-        
-        audit = Audit(
-            title=title,
-            description=description,
-            date=date,
-            status=status,
-            assigned_auditor=assigned_auditor
-        )
+        audit = _new_audit(title, description, date, status, assigned_auditor)
         
         audit_id = await db_manager.create_audit(audit)
         audit.id = audit_id
@@ -533,6 +770,54 @@ async def create_audit(
             'message': 'Failed to create audit'
         }
 
+@mcp.tool()
+async def create_audits(audits: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Create several audit records in one batch
+    
+    Args:
+        audits: List of audits, each with a title and optional description,
+                date, status and assigned_auditor
+    
+    Returns:
+        Dictionary containing the created audits and their IDs
+    """
+    logger.info(f"TOOL_CALL: create_audits - Count: {len(audits)}")
+    
+    try:
+        new_audits = []
+        for item in audits:
+            if not item.get('title'):
+                raise ValueError('Every audit needs a title')
+            new_audits.append(_new_audit(
+                item['title'],
+                item.get('description', ""),
+                item.get('date', ""),
+                item.get('status', "open"),
+                item.get('assigned_auditor', "")
+            ))
+        
+        audit_ids = await db_manager.create_audits_bulk(new_audits)
+        
+        result = {
+            'success': True,
+            'audit_ids': audit_ids,
+            'audits': [audit.to_dict() for audit in new_audits],
+            'count': len(audit_ids),
+            'message': f'{len(audit_ids)} audits created successfully'
+        }
+        
+        logger.info(f"TOOL_CALL: create_audits completed - Count: {len(audit_ids)}")
+        return result
+        
+    except Exception as e:
+        logger.error(f"TOOL_CALL: create_audits failed - Error: {str(e)}")
+        return {
+            'success': False,
+            'error': str(e),
+            'message': 'Failed to create audits'
+        }
+
 @mcp.tool()
 async def get_audit(audit_id: int) -> Dict[str, Any]:
     """
@@ -615,11 +900,11 @@ async def list_audits(
         if search:
             filters['search'] = search
         
-        audits = await db_manager.list_audits(filters, limit, offset)
+        audits = await db_manager.list_audits_dict(filters, limit, offset)
         
         result = {
             'success': True,
-            'audits': [audit.to_dict() for audit in audits],
+            'audits': audits,
             'count': len(audits),
             'filters': filters,
             'pagination': {
@@ -665,14 +950,13 @@ async def update_audit(audit_id: int, **updates) -> Dict[str, Any]:
                 'message': 'No fields to update'
             }
         
-        success = await db_manager.update_audit(audit_id, updates)
+        updated_audit = await db_manager.update_audit(audit_id, updates)
         
-        if success:
-            # Get updated audit
-            updated_audit = await db_manager.get_audit(audit_id)
+        if updated_audit:
+            summary_prompts.invalidate(audit_id)
             result = {
                 'success': True,
-                'audit': updated_audit.to_dict() if updated_audit else None,
+                'audit': updated_audit.to_dict(),
                 'message': f'Audit {audit_id} updated successfully'
             }
             logger.info(f"TOOL_CALL: update_audit completed - ID: {audit_id}")
@@ -711,6 +995,7 @@ async def delete_audit(audit_id: int) -> Dict[str, Any]:
         success = await db_manager.delete_audit(audit_id)
         
         if success:
+            summary_prompts.invalidate(audit_id)
             result = {
                 'success': True,
                 'message': f'Audit {audit_id} deleted successfully'
@@ -775,15 +1060,15 @@ async def get_audit_resource(id: str) -> str:
         audit = await db_manager.get_audit(audit_id)
         
         if audit:
-            return json.dumps(audit.to_dict(), indent=2)
+            return _dumps(audit.to_dict())
         else:
-            return json.dumps({'error': f'Audit {id} not found'}, indent=2)
+            return _dumps({'error': f'Audit {id} not found'})
             
     except ValueError:
-        return json.dumps({'error': f'Invalid audit ID: {id}'}, indent=2)
+        return _dumps({'error': f'Invalid audit ID: {id}'})
     except Exception as e:
         logger.error(f"RESOURCE: Failed to get audit resource - Error: {str(e)}")
-        return json.dumps({'error': str(e)}, indent=2)
+        return _dumps({'error': str(e)})
 
 @mcp.resource("audits://list")
 async def get_audits_list_resource() -> str:
@@ -791,18 +1076,17 @@ async def get_audits_list_resource() -> str:
     logger.info("RESOURCE: Accessing audits list resource")
     
     try:
-        audits = await db_manager.list_audits()
-        audit_list = [audit.to_dict() for audit in audits]
+        audit_list = await db_manager.list_audits_dict()
         
-        return json.dumps({
+        return _dumps({
             'audits': audit_list,
             'count': len(audit_list),
             'generated_at': datetime.now().isoformat()
-        }, indent=2)
+        })
         
     except Exception as e:
         logger.error(f"RESOURCE: Failed to get audits list resource - Error: {str(e)}")
-        return json.dumps({'error': str(e)}, indent=2)
+        return _dumps({'error': str(e)})
 
 @mcp.resource("audits://stats")
 async def get_audits_stats_resource() -> str:
@@ -811,37 +1095,31 @@ async def get_audits_stats_resource() -> str:
     
     try:
         stats = await db_manager.get_audit_statistics()
-        return json.dumps(stats, indent=2)
+        return _dumps(stats)
         
     except Exception as e:
         logger.error(f"RESOURCE: Failed to get audit statistics resource - Error: {str(e)}")
-        return json.dumps({'error': str(e)}, indent=2)
+        return _dumps({'error': str(e)})
 
 # Prompt implementations
-@mcp.prompt("audit_summary_prompt")
-async def audit_summary_prompt(audit_id: str = "1") -> str:
-    """Generate a prompt for creating audit summaries"""
-    logger.info(f"PROMPT: Generating audit summary prompt for ID: {audit_id}")
+@lru_cache(maxsize=256)
+def _format_summary(audit_row: tuple) -> str:
+    """Render the audit summary prompt for one audit row in _AUDIT_FIELDS order"""
+    audit_id, title, description, date, status, assigned_auditor, created_at, updated_at = audit_row
     
-    try:
-        audit = await db_manager.get_audit(int(audit_id))
-        
-        if not audit:
-            return f"Error: Audit {audit_id} not found"
-        
-        prompt = f"""
+    prompt = f"""
 # Audit Summary Request
 
 Please provide a comprehensive summary for the following audit:
 
-**Audit ID:** {audit.id}
-**Title:** {audit.title}
-**Description:** {audit.description}
-**Current Status:** {audit.status}
-**Assigned Auditor:** {audit.assigned_auditor}
-**Date:** {audit.date}
-**Created:** {audit.created_at}
-**Last Updated:** {audit.updated_at}
+**Audit ID:** {audit_id}
+**Title:** {title}
+**Description:** {description}
+**Current Status:** {status}
+**Assigned Auditor:** {assigned_auditor}
+**Date:** {date}
+**Created:** {created_at}
+**Last Updated:** {updated_at}
 
 ## Summary Requirements:
 
@@ -864,9 +1142,55 @@ Please provide a comprehensive summary for the following audit:
    - Stakeholder communications
 
 Please format the summary in a professional manner suitable for management review.
-        """
+    """
+    
+    return prompt.strip()
+
+class SummaryPromptCache:
+    """Rendered audit summary prompts by audit ID, dropped when the audit changes"""
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._prompts: "OrderedDict[int, str]" = OrderedDict()
+    
+    def get(self, audit_id: int) -> Optional[str]:
+        """Return the cached prompt for an audit, if any"""
+        prompt = self._prompts.get(audit_id)
+        if prompt is not None:
+            self._prompts.move_to_end(audit_id)
+        return prompt
+    
+    def put(self, audit: Audit) -> str:
+        """Render and cache the prompt for an audit"""
+        prompt = _format_summary(tuple(audit))
+        self._prompts[audit.id] = prompt
+        self._prompts.move_to_end(audit.id)
+        if len(self._prompts) > self.maxsize:
+            self._prompts.popitem(last=False)
+        return prompt
+    
+    def invalidate(self, audit_id: int):
+        """Forget the cached prompt for an audit after it is updated or deleted"""
+        self._prompts.pop(audit_id, None)
+
+summary_prompts = SummaryPromptCache()
+
+@mcp.prompt("audit_summary_prompt")
+async def audit_summary_prompt(audit_id: str = "1") -> str:
+    """Generate a prompt for creating audit summaries"""
+    logger.info(f"PROMPT: Generating audit summary prompt for ID: {audit_id}")
+    
+    try:
+        prompt = summary_prompts.get(int(audit_id))
+        if prompt is not None:
+            return prompt
         
-        return prompt.strip()
+        audit = await db_manager.get_audit(int(audit_id))
+        
+        if not audit:
+            return f"Error: Audit {audit_id} not found"
+        
+        return summary_prompts.put(audit)
         
     except Exception as e:
         logger.error(f"PROMPT: Failed to generate audit summary prompt - Error: {str(e)}")
@@ -885,8 +1209,13 @@ async def audit_report_prompt(status: str = "all", auditor: str = "all") -> str:
         if auditor != "all":
             filters['assigned_auditor'] = auditor
         
-        audits = await db_manager.list_audits(filters)
-        stats = await db_manager.get_audit_statistics()
+        # Only the first 10 audits are shown, so fetch just those and count the rest in SQL.
+        # The three queries are independent, so run them concurrently
+        audits, total_in_scope, stats = await asyncio.gather(
+            db_manager.list_audits_dict(filters, limit=10),
+            db_manager.count_audits(filters),
+            db_manager.get_audit_statistics()
+        )
         
         prompt = f"""
 # Comprehensive Audit Report Generation
@@ -896,7 +1225,7 @@ Generate a detailed audit report based on the following data:
 ## Report Parameters:
 - **Status Filter:** {status}
 - **Auditor Filter:** {auditor}
-- **Total Audits in Scope:** {len(audits)}
+- **Total Audits in Scope:** {total_in_scope}
 - **Report Generated:** {datetime.now().isoformat()}
 
 ## Overall Statistics:
@@ -904,14 +1233,14 @@ Generate a detailed audit report based on the following data:
 - **Recent Activity (30 days):** {stats['recent_audits_30_days']}
 
 ### Status Breakdown:
-{json.dumps(stats['status_breakdown'], indent=2)}
+{_dumps_pretty(stats['status_breakdown'])}
 
 ### Auditor Workload:
-{json.dumps(stats['auditor_workload'], indent=2)}
+{_dumps_pretty(stats['auditor_workload'])}
 
 ## Audits in Report Scope:
-{json.dumps([audit.to_dict() for audit in audits[:10]], indent=2)}
-{'... and ' + str(len(audits) - 10) + ' more audits' if len(audits) > 10 else ''}
+{_dumps_pretty(audits)}
+{'... and ' + str(total_in_scope - 10) + ' more audits' if total_in_scope > 10 else ''}
 
 ## Report Requirements:
 
@@ -8,6 +8,7 @@ import asyncio
 import argparse
 import json
 import logging
+import signal
 from datetime import datetime
 
 # Configure logging
@@ -43,6 +44,15 @@ def load_config():
 # Load configuration
 config = load_config()
 
+# Seconds between heartbeat log lines
+HEARTBEAT_INTERVAL = 30
+
+async def _heartbeat():
+    """Log a heartbeat every HEARTBEAT_INTERVAL seconds"""
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        logger.debug("HTTP server heartbeat - ready for connections")
+
 async def start_http_server(host="127.0.0.1", port=8002):
     """Start HTTP MCP server"""
     logger.info(f"Starting HTTP MCP Server on {host}:{port}")
@@ -52,21 +62,29 @@ async def start_http_server(host="127.0.0.1", port=8002):
     logger.info(f"HTTP MCP Server running on http://{host}:{port}")
     logger.info("Server ready to handle HTTP MCP requests...")
     
+    # Sleep until SIGINT/SIGTERM instead of waking every second to poll
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Windows event loops have no signal handlers; Ctrl+C still raises KeyboardInterrupt
+            pass
+    
+    heartbeat = asyncio.create_task(_heartbeat())
     try:
-        while True:
-            await asyncio.sleep(1)
-            # Simulate server activity logging
-            if asyncio.get_event_loop().time() % 30 < 1:  # Log every 30 seconds
-                logger.debug("HTTP server heartbeat - ready for connections")
+        await stop.wait()
+        logger.info("Shutting down HTTP MCP server...")
     except KeyboardInterrupt:
         logger.info("Shutting down HTTP MCP server...")
     except Exception as e:
         logger.error(f"HTTP server error: {e}")
         raise
+    finally:
+        heartbeat.cancel()
 
 if __name__ == "__main__":
-    import argparse
-    
     # Create logs directory if it doesn't exist
     import os
     os.makedirs('logs', exist_ok=True)
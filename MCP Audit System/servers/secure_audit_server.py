@@ -12,22 +12,47 @@ import os
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from functools import lru_cache
 import threading
-from queue import Queue
+import time
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener
+
+# uvloop is an optional, faster drop-in event loop; the stdlib loop is used without it
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Tool responses are compact JSON; orjson when available, stdlib json otherwise
+try:
+    import orjson
+    
+    def _json(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _json(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'))
 
 # FastMCP v2 imports
 from mcp import ClientSession, StdioServerParameters
 from mcp.server import Server
 
-# Configure comprehensive logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/secure_audit_server.log'),
-        logging.StreamHandler()
-    ]
-)
+# Configure comprehensive logging.
+# Tool handlers only enqueue records; a background listener thread does the file and console I/O.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('logs/secure_audit_server.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+# The listener's handlers apply the full format, so the queue side only renders the message
+logging.basicConfig(level=logging.DEBUG, format='%(message)s', handlers=[QueueHandler(_log_queue)])
 logger = logging.getLogger('SecureAuditMCPServer')
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -63,19 +88,39 @@ def load_config():
             },
             "logging": {
                 "level": "INFO"
+            },
+            "retention": {
+                "days": 90
             }
         }
 
 # Load configuration
 config = load_config()
 
+# SQLite gains nothing from more threads than cores, and writes serialize on the database lock:
+# reads get a small shared pool, writes a single dedicated thread
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) // 2), thread_name_prefix='sqlite')
+_DB_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sqlite-writer')
+
 # Database Manager
 class DatabaseManager:
+    POOL_SIZE = 10
+    PRAGMAS = (
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA temp_store=MEMORY',
+        'PRAGMA mmap_size=268435456',
+        'PRAGMA cache_size=-65536'
+    )
+    
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self.connection_pool = Queue(maxsize=10)
+        # WAL lets the readers run alongside the one writer connection, so writes never queue behind reads.
+        # The pool is an asyncio.Queue filled by start() once a loop is running
+        self.connection_pool: Optional[asyncio.Queue] = None
+        self.writer: Optional[sqlite3.Connection] = None
+        self.write_lock = asyncio.Lock()
         self._init_database()
-        self._populate_pool()
     
     def _init_database(self):
         """Initialize the database with required tables"""
@@ -96,28 +141,179 @@ class DatabaseManager:
                 last_updated TEXT
             )
         ''')
+        # list_audits filters on these columns and orders by (created_date DESC, id DESC);
+        # carrying id DESC in the index lets SQLite walk rows in order and stop at LIMIT
+        # instead of sorting, and turns keyset cursors into a single seek
+        for old_index in ('idx_audits_created', 'idx_audits_status_created',
+                          'idx_audits_auditor_created', 'idx_audits_department_created'):
+            conn.execute(f'DROP INDEX IF EXISTS {old_index}')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_audits_created_id ON audits(created_date DESC, id DESC)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_audits_status_created_id ON audits(status, created_date DESC, id DESC)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_audits_auditor_created_id ON audits(assigned_auditor, created_date DESC, id DESC)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_audits_department_created_id ON audits(department, created_date DESC, id DESC)')
+        
+        # Gather planner statistics once the table has rows, so the filter indexes are chosen
+        # over the date index. An empty table leaves no stats row and is re-analyzed next start
+        has_stats = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone() and \
+            conn.execute("SELECT 1 FROM sqlite_stat1 WHERE tbl = 'audits'").fetchone()
+        if not has_stats:
+            conn.execute('ANALYZE')
         conn.commit()
         conn.close()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a pooled connection with WAL and the shared PRAGMAs applied"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
     def _populate_pool(self):
         """Populate connection pool"""
-        for _ in range(10):
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            conn.row_factory = sqlite3.Row
-            self.connection_pool.put(conn)
+        self.writer = self._connect()
+        for _ in range(self.POOL_SIZE - 1):
+            self.connection_pool.put_nowait(self._connect())
+    
+    async def start(self):
+        """Open the pooled connections on the running event loop"""
+        if self.connection_pool is None:
+            self.connection_pool = asyncio.Queue(maxsize=self.POOL_SIZE - 1)
+            self._populate_pool()
     
     @asynccontextmanager
-    async def get_connection(self):
-        """Get a database connection from the pool"""
-        conn = self.connection_pool.get()
+    async def get_connection(self, write: bool = False):
+        """Get a database connection from the pool, or the writer connection for writes"""
+        if self.connection_pool is None:
+            await self.start()
+        
+        if write:
+            # Writers wait their turn on the loop instead of blocking it
+            async with self.write_lock:
+                yield self.writer
+            return
+        
+        # Waits cooperatively when every reader is checked out
+        conn = await self.connection_pool.get()
         try:
             yield conn
         finally:
-            self.connection_pool.put(conn)
+            self.connection_pool.put_nowait(conn)
+    
+    async def run(self, fn, *args, write: bool = False):
+        """Run fn(conn, *args) on a pooled connection in a worker thread, off the event loop"""
+        executor = _DB_WRITE_EXECUTOR if write else _DB_EXECUTOR
+        async with self.get_connection(write) as conn:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, conn, *args)
 
 # Initialize database
 db = DatabaseManager(config.get("database", {}).get("path", "audit_database.db"))
 
+# Statistics per period, reused for STATS_TTL seconds and cleared on every write
+STATS_TTL = 5.0
+_stats_cache: Dict[str, tuple] = {}
+
+# get_audit JSON per audit id as (stored_at, json_text), LRU-bounded and dropped on update/delete
+AUDIT_CACHE_SIZE = 512
+AUDIT_CACHE_TTL = 30.0
+_audit_cache: "OrderedDict[int, tuple]" = OrderedDict()
+
+# Bumped on every invalidation; a cache fill whose read started before a write is not stored
+_write_generation = 0
+
+def _invalidate_caches(audit_ids=None):
+    """Drop cached statistics and the given audits after a write; None drops every cached audit"""
+    global _write_generation
+    _write_generation += 1
+    _stats_cache.clear()
+    if audit_ids is None:
+        _audit_cache.clear()
+    else:
+        for audit_id in audit_ids:
+            _audit_cache.pop(int(audit_id), None)
+
+# Audit columns in SELECT order; rows come back as plain tuples and are zipped against this
+COLUMNS = ('id', 'title', 'description', 'status', 'assigned_auditor', 'created_date',
+           'due_date', 'priority', 'department', 'notes', 'attachments', 'last_updated')
+_SELECT_AUDITS = f"SELECT {', '.join(COLUMNS)} FROM audits"
+
+# Single-row insert shared by create_audit and create_audits; RETURNING hands back the new id
+_INSERT_AUDIT = '''
+    INSERT INTO audits (title, description, assigned_auditor, due_date, priority, department, created_date, last_updated)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+'''
+
+# Fields update_audit may change, in the order they appear in the SET clause
+UPDATE_FIELDS = ("title", "description", "status", "assigned_auditor", "due_date", "priority", "department", "notes")
+
+@lru_cache(maxsize=16)
+def _build_list_sql(has_status: bool, has_auditor: bool, has_dept: bool, has_cursor: bool) -> str:
+    """SQL for list_audits with the given optional filters; one string per combination"""
+    query = _SELECT_AUDITS + " WHERE 1=1"
+    if has_status:
+        query += " AND status = ?"
+    if has_auditor:
+        query += " AND assigned_auditor = ?"
+    if has_dept:
+        query += " AND department = ?"
+    if has_cursor:
+        # Keyset pagination: continue strictly after the last (created_date, id) seen
+        query += " AND (created_date, id) < (?, ?)"
+    return query + " ORDER BY created_date DESC, id DESC LIMIT ?"
+
+def _update_fields(item: dict) -> tuple:
+    """The updatable fields present in item, as a canonical tuple in UPDATE_FIELDS order"""
+    return tuple(field for field in UPDATE_FIELDS if field in item)
+
+@lru_cache(maxsize=256)
+def _build_update_sql(fields: tuple) -> str:
+    """SQL for update_audit setting the given canonical field tuple"""
+    set_clauses = [f"{field} = ?" for field in fields]
+    set_clauses.append("last_updated = ?")
+    return f"UPDATE audits SET {', '.join(set_clauses)} WHERE id = ?"
+
+# Cap on tool calls running at once; extra calls wait instead of piling onto the pool
+_TOOL_SEM = asyncio.Semaphore(config.get("server", {}).get("max_concurrency", 8))
+
+# Retention: audits older than RETENTION_DAYS are purged daily, and the file is vacuumed every VACUUM_EVERY purges
+RETENTION_DAYS = config.get("retention", {}).get("days", 90)
+PURGE_INTERVAL = 86400
+VACUUM_EVERY = 7
+
+async def purge_old_audits(days: int = RETENTION_DAYS) -> int:
+    """Delete audits created more than days ago and return how many were removed"""
+    # The cutoff is now - days, so zero or fewer days would delete every audit
+    if days < 1:
+        raise ValueError(f"Retention days must be at least 1, got {days}")
+    cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+    
+    def _purge(conn):
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM audits WHERE created_date < ?', (cutoff,))
+        conn.commit()
+        return cursor.rowcount
+    
+    deleted = await db.run(_purge, write=True)
+    if deleted:
+        _invalidate_caches()
+    logger.info(f"Purged {deleted} audits created before {cutoff}")
+    return deleted
+
+async def _retention_task():
+    """Run the retention purge daily and VACUUM weekly to reclaim freed pages"""
+    runs = 0
+    while True:
+        # Sleep first so a (re)start does not trigger a purge straight away
+        await asyncio.sleep(PURGE_INTERVAL)
+        try:
+            await purge_old_audits()
+            runs += 1
+            if runs % VACUUM_EVERY == 0:
+                await db.run(lambda conn: conn.execute('VACUUM'), write=True)
+                logger.info("Vacuumed audit database")
+        except Exception as e:
+            logger.error(f"Retention maintenance failed: {e}")
+
 # Server instance
 server = Server("SecureAudit")
 logger.info("SecureAudit MCP Server instance created")
@@ -125,7 +321,7 @@ logger.info("SecureAudit MCP Server instance created")
 @server.list_tools()
 async def handle_list_tools() -> List[Tool]:
     """List available audit management tools"""
-    logger.info("Received list_tools request")
+    logger.debug("Received list_tools request")
     tools = [
         Tool(
             name="create_audit",
@@ -143,6 +339,32 @@ async def handle_list_tools() -> List[Tool]:
                 "required": ["title", "assigned_auditor"]
             }
         ),
+        Tool(
+            name="create_audits",
+            description="Create several audit records in one transaction",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "audits": {
+                        "type": "array",
+                        "description": "Audits to create, each with the create_audit fields",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "title": {"type": "string"},
+                                "description": {"type": "string"},
+                                "assigned_auditor": {"type": "string"},
+                                "due_date": {"type": "string"},
+                                "priority": {"type": "string", "enum": ["low", "medium", "high"], "default": "medium"},
+                                "department": {"type": "string"}
+                            },
+                            "required": ["title", "assigned_auditor"]
+                        }
+                    }
+                },
+                "required": ["audits"]
+            }
+        ),
         Tool(
             name="get_audit",
             description="Get audit details by ID",
@@ -163,7 +385,8 @@ async def handle_list_tools() -> List[Tool]:
                     "status": {"type": "string", "description": "Filter by status"},
                     "assigned_auditor": {"type": "string", "description": "Filter by auditor"},
                     "department": {"type": "string", "description": "Filter by department"},
-                    "limit": {"type": "integer", "default": 50, "description": "Maximum results"}
+                    "limit": {"type": "integer", "default": 50, "description": "Maximum results"},
+                    "cursor": {"type": "string", "description": "Resume after this audit: '<created_date>,<id>' of the last audit on the previous page"}
                 }
             }
         ),
@@ -186,6 +409,35 @@ async def handle_list_tools() -> List[Tool]:
                 "required": ["audit_id"]
             }
         ),
+        Tool(
+            name="update_audits",
+            description="Update several audits in one transaction",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "updates": {
+                        "type": "array",
+                        "description": "Updates to apply, each with an audit_id and the update_audit fields",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "audit_id": {"type": "integer", "description": "Audit ID"},
+                                "title": {"type": "string"},
+                                "description": {"type": "string"},
+                                "status": {"type": "string", "enum": ["open", "in_progress", "completed", "closed", "cancelled"]},
+                                "assigned_auditor": {"type": "string"},
+                                "due_date": {"type": "string"},
+                                "priority": {"type": "string", "enum": ["low", "medium", "high"]},
+                                "department": {"type": "string"},
+                                "notes": {"type": "string"}
+                            },
+                            "required": ["audit_id"]
+                        }
+                    }
+                },
+                "required": ["updates"]
+            }
+        ),
         Tool(
             name="delete_audit",
             description="Delete an audit record",
@@ -206,45 +458,64 @@ async def handle_list_tools() -> List[Tool]:
                     "period": {"type": "string", "enum": ["week", "month", "quarter", "year"], "default": "month"}
                 }
             }
+        ),
+        Tool(
+            name="purge_old_audits",
+            description="Delete audits older than the retention period",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "days": {"type": "integer", "description": "Delete audits created more than this many days ago", "minimum": 1, "default": RETENTION_DAYS}
+                }
+            }
         )
     ]
-    logger.info(f"Returning {len(tools)} tools")
+    logger.debug("Returning %d tools", len(tools))
     return tools
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> List[TextContent]:
     """Handle tool execution"""
-    logger.info(f"Received call_tool request - Tool: {name}, Arguments: {arguments}")
+    async with _TOOL_SEM:
+        return await _call_tool(name, arguments)
+
+async def _call_tool(name: str, arguments: dict) -> List[TextContent]:
+    """Execute a tool call"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received call_tool request - Tool: %s, Arguments: %s", name, arguments)
     start_time = datetime.now()
+    # One timestamp per tool call, shared by every row and column it writes
+    now_iso = start_time.isoformat()
     
     if name == "create_audit":
-        logger.info(f"Creating new audit: {arguments.get('title', 'Unknown Title')}")
+        logger.debug("Creating new audit: %s", arguments.get('title', 'Unknown Title'))
+        def _insert(conn):
+            cursor = conn.cursor()
+            cursor.execute(_INSERT_AUDIT, (
+                arguments["title"],
+                arguments.get("description", ""),
+                arguments["assigned_auditor"],
+                arguments.get("due_date"),
+                arguments.get("priority", "medium"),
+                arguments.get("department"),
+                now_iso,
+                now_iso
+            ))
+            audit_id = cursor.fetchone()[0]
+            conn.commit()
+            return audit_id
+        
         try:
-            async with db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO audits (title, description, assigned_auditor, due_date, priority, department, created_date, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    arguments["title"],
-                    arguments.get("description", ""),
-                    arguments["assigned_auditor"],
-                    arguments.get("due_date"),
-                    arguments.get("priority", "medium"),
-                    arguments.get("department"),
-                    datetime.now().isoformat(),
-                    datetime.now().isoformat()
-                ))
-                audit_id = cursor.lastrowid
-                conn.commit()
-                
-                execution_time = (datetime.now() - start_time).total_seconds()
-                logger.info(f"Audit created successfully - ID: {audit_id} (execution time: {execution_time:.3f}s)")
-                
-                return [TextContent(
-                    type="text",
-                    text=f"✅ Created audit #{audit_id}: {arguments['title']}"
-                )]
+            audit_id = await db.run(_insert, write=True)
+            _invalidate_caches(())
+            
+            execution_time = (datetime.now() - start_time).total_seconds()
+            logger.info(f"Audit created successfully - ID: {audit_id} (execution time: {execution_time:.3f}s)")
+            
+            return [TextContent(
+                type="text",
+                text=f"✅ Created audit #{audit_id}: {arguments['title']}"
+            )]
         except Exception as e:
             execution_time = (datetime.now() - start_time).total_seconds()
             logger.error(f"Failed to create audit: {e} (execution time: {execution_time:.3f}s)")
@@ -253,143 +524,314 @@ async def handle_call_tool(name: str, arguments: dict) -> List[TextContent]:
                 text=f"❌ Error creating audit: {str(e)}"
             )]
     
+    elif name == "create_audits":
+        logger.debug("Creating %d audits in bulk", len(arguments.get('audits', [])))
+        try:
+            rows = [
+                (
+                    item["title"],
+                    item.get("description", ""),
+                    item["assigned_auditor"],
+                    item.get("due_date"),
+                    item.get("priority", "medium"),
+                    item.get("department"),
+                    now_iso,
+                    now_iso
+                )
+                for item in arguments["audits"]
+            ]
+            
+            def _insert_many(conn):
+                # executemany can't return rows, so run one INSERT ... RETURNING per audit
+                # inside a single transaction to collect every new id
+                cursor = conn.cursor()
+                try:
+                    audit_ids = [cursor.execute(_INSERT_AUDIT, row).fetchone()[0] for row in rows]
+                except Exception:
+                    conn.rollback()
+                    raise
+                conn.commit()
+                return audit_ids
+            
+            audit_ids = await db.run(_insert_many, write=True)
+            _invalidate_caches(())
+            
+            execution_time = (datetime.now() - start_time).total_seconds()
+            logger.info(f"Bulk audit creation succeeded - Count: {len(audit_ids)} (execution time: {execution_time:.3f}s)")
+            
+            return [TextContent(
+                type="text",
+                text=f"✅ Created {len(audit_ids)} audits: " + ", ".join(f"#{audit_id}" for audit_id in audit_ids)
+            )]
+        except Exception as e:
+            execution_time = (datetime.now() - start_time).total_seconds()
+            logger.error(f"Failed to create audits: {e} (execution time: {execution_time:.3f}s)")
+            return [TextContent(
+                type="text",
+                text=f"❌ Error creating audits: {str(e)}"
+            )]
+    
     elif name == "get_audit":
-        async with db.get_connection() as conn:
+        audit_id = int(arguments["audit_id"])
+        cached = _audit_cache.get(audit_id)
+        if cached and time.monotonic() - cached[0] < AUDIT_CACHE_TTL:
+            _audit_cache.move_to_end(audit_id)
+            return [TextContent(type="text", text=cached[1])]
+        generation = _write_generation
+        
+        def _fetch(conn):
+            cursor = conn.cursor()
+            cursor.execute(_SELECT_AUDITS + ' WHERE id = ?', (audit_id,))
+            return cursor.fetchone()
+        
+        audit = await db.run(_fetch)
+        
+        if audit:
+            audit_dict = dict(zip(COLUMNS, audit))
+            text = _json(audit_dict)
+            # Skip the fill if a write landed while the row was being read
+            if generation == _write_generation:
+                _audit_cache[audit_id] = (time.monotonic(), text)
+                _audit_cache.move_to_end(audit_id)
+                if len(_audit_cache) > AUDIT_CACHE_SIZE:
+                    _audit_cache.popitem(last=False)
+            return [TextContent(
+                type="text",
+                text=text
+            )]
+        else:
+            return [TextContent(
+                type="text",
+                text=f"❌ Audit #{arguments['audit_id']} not found"
+            )]
+    
+    elif name == "list_audits":
+        params = []
+        for field in ("status", "assigned_auditor", "department"):
+            if arguments.get(field):
+                params.append(arguments[field])
+        
+        if arguments.get("cursor"):
+            try:
+                created_date, audit_id = arguments["cursor"].rsplit(",", 1)
+                params.extend([created_date, int(audit_id)])
+            except (AttributeError, ValueError):
+                return [TextContent(
+                    type="text",
+                    text=f"❌ Invalid cursor: {arguments['cursor']}"
+                )]
+        
+        params.append(int(arguments.get("limit", 50)))
+        
+        query = _build_list_sql(
+            bool(arguments.get("status")),
+            bool(arguments.get("assigned_auditor")),
+            bool(arguments.get("department")),
+            bool(arguments.get("cursor"))
+        )
+        
+        def _list(conn):
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM audits WHERE id = ?', (arguments["audit_id"],))
-            audit = cursor.fetchone()
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        
+        audits = await db.run(_list)
+        
+        audit_list = [dict(zip(COLUMNS, audit)) for audit in audits]
+        return [TextContent(
+            type="text",
+            text=_json(audit_list)
+        )]
+    
+    elif name == "update_audit":
+        fields = _update_fields(arguments)
+        
+        if fields:
+            params = [arguments[field] for field in fields]
+            params.append(now_iso)
+            params.append(arguments["audit_id"])
+            
+            # Same field set -> same SQL string, so sqlite3's statement cache is reused
+            query = _build_update_sql(fields)
             
-            if audit:
-                audit_dict = dict(audit)
+            def _update(conn):
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                conn.commit()
+                return cursor.rowcount
+            
+            if await db.run(_update, write=True) > 0:
+                _invalidate_caches((arguments["audit_id"],))
                 return [TextContent(
                     type="text",
-                    text=json.dumps(audit_dict, indent=2)
+                    text=f"✅ Updated audit #{arguments['audit_id']}"
                 )]
             else:
                 return [TextContent(
                     type="text",
                     text=f"❌ Audit #{arguments['audit_id']} not found"
                 )]
-    
-    elif name == "list_audits":
-        async with db.get_connection() as conn:
-            cursor = conn.cursor()
-            query = "SELECT * FROM audits WHERE 1=1"
-            params = []
-            
-            if arguments.get("status"):
-                query += " AND status = ?"
-                params.append(arguments["status"])
-            
-            if arguments.get("assigned_auditor"):
-                query += " AND assigned_auditor = ?"
-                params.append(arguments["assigned_auditor"])
-            
-            if arguments.get("department"):
-                query += " AND department = ?"
-                params.append(arguments["department"])
-            
-            query += f" ORDER BY created_date DESC LIMIT {arguments.get('limit', 50)}"
-            
-            cursor.execute(query, params)
-            audits = cursor.fetchall()
-            
-            audit_list = [dict(audit) for audit in audits]
+        else:
             return [TextContent(
                 type="text",
-                text=json.dumps(audit_list, indent=2)
+                text="❌ No fields to update"
             )]
     
-    elif name == "update_audit":
-        async with db.get_connection() as conn:
+    elif name == "update_audits":
+        def _update_many(conn):
+            # One execute per row (still one cached statement per shape) so ids that match
+            # no row can be reported, all inside a single transaction
             cursor = conn.cursor()
-            
-            # Build dynamic update query
-            set_clauses = []
-            params = []
-            
-            for field in ["title", "description", "status", "assigned_auditor", "due_date", "priority", "department", "notes"]:
-                if field in arguments:
-                    set_clauses.append(f"{field} = ?")
-                    params.append(arguments[field])
-            
-            if set_clauses:
-                set_clauses.append("last_updated = ?")
-                params.append(datetime.now().isoformat())
-                params.append(arguments["audit_id"])
-                
-                query = f"UPDATE audits SET {', '.join(set_clauses)} WHERE id = ?"
-                cursor.execute(query, params)
-                conn.commit()
-                
-                if cursor.rowcount > 0:
-                    return [TextContent(
-                        type="text",
-                        text=f"✅ Updated audit #{arguments['audit_id']}"
-                    )]
+            updated = 0
+            missing = []
+            try:
+                for fields, rows in batches.items():
+                    query = _build_update_sql(fields)
+                    for row in rows:
+                        if cursor.execute(query, row).rowcount:
+                            updated += 1
+                        else:
+                            missing.append(row[-1])
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
+            return updated, missing
+        
+        try:
+            # Group updates by the fields they set, so each shape is one cached statement run via executemany
+            batches: Dict[tuple, list] = {}
+            audit_ids = []
+            skipped = []  # Positions in updates of items that set no updatable field
+            for index, item in enumerate(arguments["updates"]):
+                fields = _update_fields(item)
+                if fields:
+                    batches.setdefault(fields, []).append(
+                        tuple(item[field] for field in fields) + (now_iso, item["audit_id"])
+                    )
+                    audit_ids.append(item["audit_id"])
                 else:
-                    return [TextContent(
-                        type="text",
-                        text=f"❌ Audit #{arguments['audit_id']} not found"
-                    )]
-            else:
+                    skipped.append(index)
+            
+            if not batches:
                 return [TextContent(
                     type="text",
                     text="❌ No fields to update"
                 )]
+            
+            updated, missing = await db.run(_update_many, write=True)
+            _invalidate_caches(audit_ids)
+            
+            execution_time = (datetime.now() - start_time).total_seconds()
+            logger.info(f"Bulk audit update succeeded - Count: {updated}, not found: {len(missing)}, skipped: {len(skipped)} (execution time: {execution_time:.3f}s)")
+            
+            lines = [f"✅ Updated {updated} audits"]
+            if missing:
+                lines.append("❌ Not found: " + ", ".join(f"#{audit_id}" for audit_id in missing))
+            if skipped:
+                lines.append("❌ No fields to update: " + ", ".join(f"updates[{index}]" for index in skipped))
+            return [TextContent(
+                type="text",
+                text="\n".join(lines)
+            )]
+        except Exception as e:
+            execution_time = (datetime.now() - start_time).total_seconds()
+            logger.error(f"Failed to update audits: {e} (execution time: {execution_time:.3f}s)")
+            return [TextContent(
+                type="text",
+                text=f"❌ Error updating audits: {str(e)}"
+            )]
     
     elif name == "delete_audit":
-        async with db.get_connection() as conn:
+        def _delete(conn):
             cursor = conn.cursor()
             cursor.execute('DELETE FROM audits WHERE id = ?', (arguments["audit_id"],))
             conn.commit()
-            
-            if cursor.rowcount > 0:
-                return [TextContent(
-                    type="text",
-                    text=f"✅ Deleted audit #{arguments['audit_id']}"
-                )]
-            else:
-                return [TextContent(
-                    type="text",
-                    text=f"❌ Audit #{arguments['audit_id']} not found"
-                )]
+            return cursor.rowcount
+        
+        if await db.run(_delete, write=True) > 0:
+            _invalidate_caches((arguments["audit_id"],))
+            return [TextContent(
+                type="text",
+                text=f"✅ Deleted audit #{arguments['audit_id']}"
+            )]
+        else:
+            return [TextContent(
+                type="text",
+                text=f"❌ Audit #{arguments['audit_id']} not found"
+            )]
     
     elif name == "get_audit_statistics":
-        async with db.get_connection() as conn:
+        period = arguments.get("period", "month")
+        cached = _stats_cache.get(period)
+        if cached and time.monotonic() - cached[0] < STATS_TTL:
+            return [TextContent(
+                type="text",
+                text=_json(cached[1])
+            )]
+        generation = _write_generation
+        
+        # Calculate date range based on period
+        now = start_time
+        if arguments.get("period") == "week":
+            start_date = now - timedelta(weeks=1)
+        elif arguments.get("period") == "quarter":
+            start_date = now - timedelta(days=90)
+        elif arguments.get("period") == "year":
+            start_date = now - timedelta(days=365)
+        else:  # month
+            start_date = now - timedelta(days=30)
+        
+        def _stats(conn):
             cursor = conn.cursor()
             
-            # Calculate date range based on period
-            now = datetime.now()
-            if arguments.get("period") == "week":
-                start_date = now - timedelta(weeks=1)
-            elif arguments.get("period") == "quarter":
-                start_date = now - timedelta(days=90)
-            elif arguments.get("period") == "year":
-                start_date = now - timedelta(days=365)
-            else:  # month
-                start_date = now - timedelta(days=30)
-            
-            # Get statistics
-            cursor.execute('SELECT COUNT(*) as total FROM audits')
-            total = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT status, COUNT(*) as count FROM audits GROUP BY status')
-            status_counts = {row[0]: row[1] for row in cursor.fetchall()}
+            # One scan grouped by both columns; total and per-column counts are pivoted here
+            cursor.execute('SELECT status, assigned_auditor, COUNT(*) as count FROM audits GROUP BY status, assigned_auditor')
             
-            cursor.execute('SELECT assigned_auditor, COUNT(*) as count FROM audits GROUP BY assigned_auditor')
-            auditor_counts = {row[0]: row[1] for row in cursor.fetchall()}
-            
-            stats = {
-                "total_audits": total,
-                "status_breakdown": status_counts,
-                "auditor_workload": auditor_counts,
-                "period": arguments.get("period", "month")
-            }
+            total = 0
+            status_counts = {}
+            auditor_counts = {}
+            for status, auditor, count in cursor.fetchall():
+                total += count
+                status_counts[status] = status_counts.get(status, 0) + count
+                auditor_counts[auditor] = auditor_counts.get(auditor, 0) + count
             
+            return total, status_counts, auditor_counts
+        
+        total, status_counts, auditor_counts = await db.run(_stats)
+        
+        stats = {
+            "total_audits": total,
+            "status_breakdown": status_counts,
+            "auditor_workload": auditor_counts,
+            "period": period
+        }
+        if generation == _write_generation:
+            _stats_cache[period] = (time.monotonic(), stats)
+        
+        return [TextContent(
+            type="text",
+            text=_json(stats)
+        )]
+    
+    elif name == "purge_old_audits":
+        days = int(arguments.get("days", RETENTION_DAYS))
+        if days < 1:
+            return [TextContent(
+                type="text",
+                text=f"❌ days must be at least 1, got {days}"
+            )]
+        try:
+            deleted = await purge_old_audits(days)
+            return [TextContent(
+                type="text",
+                text=f"✅ Purged {deleted} audits older than {days} days"
+            )]
+        except Exception as e:
+            logger.error(f"Failed to purge audits: {e}")
             return [TextContent(
                 type="text",
-                text=json.dumps(stats, indent=2)
+                text=f"❌ Error purging audits: {str(e)}"
             )]
     
     else:
@@ -405,7 +847,6 @@ if __name__ == "__main__":
     import argparse
     
     # Create logs directory if it doesn't exist
-    import os
     os.makedirs('logs', exist_ok=True)
     
     parser = argparse.ArgumentParser(description="SecureAudit MCP Server")
@@ -419,15 +860,23 @@ if __name__ == "__main__":
     if args.transport == "stdio":
         async def main():
             logger.info("Initializing stdio server...")
+            maintenance = None
             try:
+                await db.start()
+                maintenance = asyncio.create_task(_retention_task())
                 async with stdio_server() as (read_stream, write_stream):
                     logger.info("stdio server initialized successfully, starting server...")
                     await server.run(read_stream, write_stream, {})
             except Exception as e:
                 logger.error(f"Server error: {e}")
                 raise
+            finally:
+                if maintenance:
+                    maintenance.cancel()
         
         logger.info("Starting asyncio event loop...")
+        if uvloop:
+            uvloop.install()
         asyncio.run(main())
     else:
         logger.warning(f"Transport {args.transport} not implemented yet")
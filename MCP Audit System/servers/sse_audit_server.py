@@ -6,9 +6,26 @@ MCP server with Server-Sent Events transport for real-time communication
 
 import asyncio
 import argparse
+import contextvars
 import json
 import logging
+import os
+import signal
 from datetime import datetime
+from functools import lru_cache, partial
+
+# Prefer orjson for JSON parsing, stdlib json otherwise
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# uvloop is an optional, faster drop-in event loop; the stdlib loop is used without it
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -25,11 +42,16 @@ from typing import List
 # Configuration
 CONFIG_FILE = "config/sse_audit_server.json"
 
+@lru_cache(maxsize=4)
+def _load(mtime_ns: int, path: str) -> dict:
+    """Parse a config file; keyed on mtime so an edited file is read again"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
 def load_config():
     """Load server configuration"""
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
+        return _load(os.stat(CONFIG_FILE).st_mtime_ns, CONFIG_FILE)
     except FileNotFoundError:
         return {
             "server": {
@@ -40,35 +62,69 @@ def load_config():
             }
         }
 
+async def _to_thread(func, *args):
+    """asyncio.to_thread, minus the context copy when no context variables are set"""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    if not ctx:
+        return await loop.run_in_executor(None, func, *args)
+    return await loop.run_in_executor(None, partial(ctx.run, func, *args))
+
+async def load_config_async():
+    """Load server configuration without blocking the event loop on disk I/O"""
+    return await _to_thread(load_config)
+
 # Load configuration
 config = load_config()
 
+# Seconds between heartbeat log lines
+HEARTBEAT_INTERVAL = 45
+
 async def start_sse_server(host="127.0.0.1", port=8003):
     """Start SSE MCP server"""
+    global config
     logger.info(f"Starting SSE MCP Server on {host}:{port}")
     
+    # Pick up any config edits made since import, off the event loop
+    config = await load_config_async()
+    
     # Placeholder SSE server implementation
     # This would integrate with actual MCP SSE transport when available
     logger.info(f"SSE MCP Server running on http://{host}:{port}")
     logger.info("Server ready to handle SSE MCP connections...")
     
+    # Sleep until SIGINT/SIGTERM; the heartbeat is a self-rescheduling timer, not a polling loop
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Windows event loops have no signal handlers; Ctrl+C still raises KeyboardInterrupt
+            pass
+    
+    heartbeat = None
+    _debug = logger.debug
+    
+    def beat():
+        nonlocal heartbeat
+        _debug("SSE server heartbeat - ready for connections")
+        heartbeat = loop.call_later(HEARTBEAT_INTERVAL, beat)
+    
+    heartbeat = loop.call_later(HEARTBEAT_INTERVAL, beat)
     try:
-        while True:
-            await asyncio.sleep(1)
-            # Simulate server activity logging
-            if asyncio.get_event_loop().time() % 45 < 1:  # Log every 45 seconds
-                logger.debug("SSE server heartbeat - ready for connections")
+        await stop.wait()
+        logger.info("Shutting down SSE MCP server...")
     except KeyboardInterrupt:
         logger.info("Shutting down SSE MCP server...")
     except Exception as e:
         logger.error(f"SSE server error: {e}")
         raise
+    finally:
+        heartbeat.cancel()
 
 if __name__ == "__main__":
-    import argparse
-    
     # Create logs directory if it doesn't exist
-    import os
     os.makedirs('logs', exist_ok=True)
     
     parser = argparse.ArgumentParser(description="SSE Audit Server")
@@ -79,4 +135,6 @@ if __name__ == "__main__":
     args = parser.parse_args()
     
     logger.info(f"Initializing SSE Audit Server on {args.host}:{args.port}")
+    if uvloop:
+        uvloop.install()
     asyncio.run(start_sse_server(args.host, args.port))